@@ -103,11 +103,15 @@ async def demo_presentation_layer():
         keyboard_adapter = KeyboardAdapter(windows_api)
         mouse_adapter = MouseAdapter(windows_api)
         
+        # 記録の進捗イベントをViewModelが受け取れるよう、サービスとViewModelで同じイベントバスを共有
+        event_bus = EventBus()
+        
         recording_service = RecordingApplicationService(
             recording_repository=recording_repo,
             settings_repository=settings_repo,
             encryption_service=encryption_service,
-            file_service=file_service
+            file_service=file_service,
+            event_bus=event_bus
         )
         
         playback_service = PlaybackApplicationService(
@@ -127,8 +131,6 @@ async def demo_presentation_layer():
         print("✓ アプリケーション層初期化完了")
         
         # プレゼンテーション層の初期化
-        event_bus = EventBus()
-        
         from src.presentation.gui.viewmodels.main_viewmodel import MainViewModel
         from src.presentation.gui.viewmodels.recording_viewmodel import RecordingViewModel
         from src.presentation.gui.views.main_window import MainWindow
@@ -6,14 +6,19 @@ UIや外部APIとの境界でドメインオブジェクトを適切な形式に
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Sequence
 from datetime import datetime
 from enum import Enum
+import sys
 
 from ...domain.value_objects import RecordingStatus, ActionType
 
 
-@dataclass
+# DTOはリスト表示などで大量に生成されるため __slots__ 化する（slots 指定は Python 3.10 以降のみ対応）
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ActionDTO:
     """アクションDTO"""
     action_id: str
@@ -36,7 +41,7 @@ class ActionDTO:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RecordingMetadataDTO:
     """記録メタデータDTO"""
     author: str
@@ -61,7 +66,7 @@ class RecordingMetadataDTO:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PlaybackSettingsDTO:
     """再生設定DTO"""
     speed_multiplier: float
@@ -82,7 +87,7 @@ class PlaybackSettingsDTO:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RecordingDTO:
     """記録DTO"""
     recording_id: str
@@ -137,7 +142,7 @@ class RecordingDTO:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RecordingSummaryDTO:
     """記録サマリーDTO（一覧表示用）"""
     recording_id: str
@@ -153,13 +158,13 @@ class RecordingSummaryDTO:
     tags: List[str]
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CreateRecordingDTO:
     """記録作成用DTO"""
     name: str
     description: Optional[str] = None
     category: str = "default"
-    tags: List[str] = field(default_factory=list)
+    tags: Sequence[str] = field(default_factory=list)
     auto_save: bool = True
     author: str = "Unknown"
     
@@ -186,13 +191,13 @@ class CreateRecordingDTO:
         return errors
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class UpdateRecordingDTO:
     """記録更新用DTO"""
     name: Optional[str] = None
     description: Optional[str] = None
     category: Optional[str] = None
-    tags: Optional[List[str]] = None
+    tags: Optional[Sequence[str]] = None
     playback_settings: Optional[Dict[str, Any]] = None
     
     def validate(self) -> List[str]:
@@ -219,7 +224,7 @@ class UpdateRecordingDTO:
         return errors
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RecordingListDTO:
     """記録一覧DTO"""
     recordings: List[RecordingSummaryDTO]
@@ -233,7 +238,7 @@ class RecordingListDTO:
     sort_order: str = "desc"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RecordingStatsDTO:
     """記録統計DTO"""
     total_recordings: int
@@ -258,7 +263,7 @@ class RecordingStatsDTO:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RecordingSearchDTO:
     """記録検索用DTO"""
     query: str
@@ -295,7 +300,7 @@ class RecordingSearchDTO:
         return errors
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RecordingExportDTO:
     """記録エクスポート用DTO"""
     recording_ids: List[str]
@@ -322,7 +327,7 @@ class RecordingExportDTO:
         return errors
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RecordingImportDTO:
     """記録インポート用DTO"""
     file_path: str
@@ -308,6 +308,33 @@ class PlaybackApplicationService:
         except Exception as e:
             return Err(ErrorInfo("STOP_PLAYBACK_ERROR", f"再生停止エラー: {str(e)}"))
 
+    async def stop_all_playbacks(self) -> Result[List[str], ErrorInfo]:
+        """
+        アクティブな再生をすべて停止する
+
+        各セッションの停止は並行して実行されます。
+
+        Returns:
+            停止に成功したセッションIDのリストまたはエラー情報
+        """
+        try:
+            session_ids = list(self._active_sessions)
+            if not session_ids:
+                return Ok([])
+
+            results = await asyncio.gather(
+                *(self.stop_playback(session_id) for session_id in session_ids)
+            )
+
+            return Ok([
+                session_id
+                for session_id, result in zip(session_ids, results)
+                if result.is_success()
+            ])
+
+        except Exception as e:
+            return Err(ErrorInfo("STOP_PLAYBACK_ERROR", f"再生停止エラー: {str(e)}"))
+
     async def get_playback_status(
         self, session_id: Optional[str] = None
     ) -> Result[PlaybackStatusDTO, ErrorInfo]:
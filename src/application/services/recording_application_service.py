@@ -9,6 +9,7 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
 
 from ...core.result import Result, Ok, Err, ErrorInfo
+from ...core.event_bus import EventBus, get_event_bus, RecordingProgressEvent
 from ...domain import Recording, ActionTypes, RecordingStatus
 from ...domain.repositories.recording_repository import IRecordingRepository
 from ...domain.repositories.settings_repository import ISettingsRepository
@@ -48,6 +49,7 @@ class RecordingApplicationService:
         settings_repository: ISettingsRepository,
         encryption_service: EncryptionService,
         file_service: FileService,
+        event_bus: Optional[EventBus] = None,
     ):
         """
         初期化
@@ -57,11 +59,13 @@ class RecordingApplicationService:
             settings_repository: 設定リポジトリ
             encryption_service: 暗号化サービス
             file_service: ファイルサービス
+            event_bus: 進捗イベントの発行先（未指定時はグローバルのイベントバス）
         """
         self._recording_repository = recording_repository
         self._settings_repository = settings_repository
         self._encryption_service = encryption_service
         self._file_service = file_service
+        self._event_bus = event_bus if event_bus is not None else get_event_bus()
 
         # ユースケースの初期化
         self._start_recording_use_case = StartRecordingUseCase(
@@ -116,7 +120,7 @@ class RecordingApplicationService:
             if recording_result.is_success():
                 recording = recording_result.value
                 recording.metadata.category = create_dto.category
-                recording.metadata.tags = create_dto.tags.copy()
+                recording.metadata.tags = list(create_dto.tags)
                 recording.metadata.author = create_dto.author
                 recording.metadata.auto_save = create_dto.auto_save
 
@@ -130,6 +134,61 @@ class RecordingApplicationService:
         except Exception as e:
             return Err(ErrorInfo("CREATE_RECORDING_ERROR", f"記録作成エラー: {str(e)}"))
 
+    async def create_and_start_recording(
+        self, create_dto: CreateRecordingDTO
+    ) -> Result[RecordingDTO, ErrorInfo]:
+        """
+        新しい記録を作成して記録を開始する
+
+        同名チェックの後、記録をメタデータ込みで組み立てて開始し、保存は1回で行います。
+
+        Args:
+            create_dto: 記録作成DTO
+
+        Returns:
+            開始された記録DTOまたはエラー情報
+        """
+        try:
+            # DTOのバリデーション
+            validation_errors = create_dto.validate()
+            if validation_errors:
+                return Err(ErrorInfo("VALIDATION_ERROR", "; ".join(validation_errors)))
+
+            # 重複記録名のチェック
+            existing_result = await self._recording_repository.get_by_name(create_dto.name)
+            if existing_result.is_success():
+                return Err(ErrorInfo(
+                    "RECORDING_NAME_DUPLICATE",
+                    f"同名の記録が既に存在します: {create_dto.name}"
+                ))
+
+            # 記録の作成（自動保存はDTOの指定を使うため設定は参照しない）
+            recording = Recording(name=create_dto.name)
+            if create_dto.description:
+                recording.metadata.description = create_dto.description
+            recording.metadata.category = create_dto.category
+            recording.metadata.tags = list(create_dto.tags)
+            recording.metadata.author = create_dto.author
+            recording.metadata.auto_save = create_dto.auto_save
+
+            # 記録を開始
+            start_result = recording.start_recording()
+            if start_result.is_failure():
+                return Err(ErrorInfo("START_RECORDING_ERROR", start_result.error))
+
+            # 保存
+            save_result = await self._recording_repository.save(recording)
+            if save_result.is_failure():
+                return save_result
+
+            # キャッシュをクリア
+            self._clear_cache()
+
+            return Ok(RecordingDTO.from_domain(recording))
+
+        except Exception as e:
+            return Err(ErrorInfo("START_RECORDING_ERROR", f"記録開始エラー: {str(e)}"))
+
     async def start_recording(self, recording_id: str) -> Result[bool, ErrorInfo]:
         """
         記録を開始する
@@ -223,6 +282,15 @@ class RecordingApplicationService:
             # キャッシュをクリア（該当記録のみ）
             self._clear_cache_for_recording(recording_id)
 
+            # 購読者がいる場合のみ、ユースケースが更新した記録から進捗イベントを発行
+            if self._event_bus.has_subscribers(RecordingProgressEvent):
+                recording = result.value
+                self._event_bus.publish(RecordingProgressEvent(
+                    recording_id=recording_id,
+                    action_count=recording.action_count,
+                    estimated_duration_ms=recording.get_estimated_duration().milliseconds,
+                ))
+
             return Ok(True)
 
         except Exception as e:
@@ -424,7 +492,7 @@ class RecordingApplicationService:
                 recording.metadata.category = update_dto.category
 
             if update_dto.tags is not None:
-                recording.metadata.tags = update_dto.tags.copy()
+                recording.metadata.tags = list(update_dto.tags)
 
             if update_dto.playback_settings is not None:
                 # プレイバック設定の更新
@@ -502,6 +570,25 @@ class RecordingApplicationService:
         except Exception as e:
             return Err(ErrorInfo("DELETE_RECORDING_ERROR", f"記録削除エラー: {str(e)}"))
 
+    async def has_any_recordings(self) -> Result[bool, ErrorInfo]:
+        """
+        記録が1件以上存在するかを確認する（件数のみを取得し、DTOは生成しない）
+
+        Returns:
+            存在する場合TrueまたはFalse、あるいはエラー情報
+        """
+        try:
+            result = await self._recording_repository.count()
+            if result.is_failure():
+                return result
+
+            return Ok(result.value > 0)
+
+        except Exception as e:
+            return Err(
+                ErrorInfo("COUNT_RECORDINGS_ERROR", f"記録件数取得エラー: {str(e)}")
+            )
+
     async def get_statistics(self) -> Result[RecordingStatsDTO, ErrorInfo]:
         """
         記録統計情報を取得する
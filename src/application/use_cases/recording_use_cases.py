@@ -123,7 +123,7 @@ class AddActionUseCase(UseCase):
     def __init__(self, recording_repository: IRecordingRepository):
         self._recording_repository = recording_repository
     
-    async def execute(self, recording_id: str, action: ActionTypes) -> Result[bool, ErrorInfo]:
+    async def execute(self, recording_id: str, action: ActionTypes) -> Result[Recording, ErrorInfo]:
         """
         記録にアクションを追加する
         
@@ -132,7 +132,7 @@ class AddActionUseCase(UseCase):
             action: 追加するアクション
             
         Returns:
-            成功フラグまたはエラー情報
+            アクション追加後の記録またはエラー情報
         """
         try:
             # 記録を取得
@@ -157,7 +157,7 @@ class AddActionUseCase(UseCase):
             if save_result.is_failure():
                 return save_result
             
-            return Ok(True)
+            return Ok(recording)
             
         except Exception as e:
             return Err(ErrorInfo("ADD_ACTION_ERROR", f"アクション追加エラー: {str(e)}"))
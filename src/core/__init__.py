@@ -35,8 +35,10 @@ from .event_bus import (
     IEventBus,
     get_event_bus,
     EventPriority,
+    HANDLER_EXPIRED,
     RecordingStartedEvent,
     RecordingStoppedEvent,
+    RecordingProgressEvent,
     PlaybackStartedEvent,
     PlaybackCompletedEvent,
     ErrorEvent,
@@ -75,8 +77,8 @@ __all__ = [
     'WindowsServiceRegistry',
     
     # Event Bus
-    'Event', 'EventBus', 'IEventBus', 'get_event_bus', 'EventPriority',
-    'RecordingStartedEvent', 'RecordingStoppedEvent', 
+    'Event', 'EventBus', 'IEventBus', 'get_event_bus', 'EventPriority', 'HANDLER_EXPIRED',
+    'RecordingStartedEvent', 'RecordingStoppedEvent', 'RecordingProgressEvent',
     'PlaybackStartedEvent', 'PlaybackCompletedEvent',
     'ErrorEvent', 'SystemEvent',
     
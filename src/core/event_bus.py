@@ -22,6 +22,9 @@ from .result import Result, ResultBuilder, ErrorInfo
 
 T = TypeVar('T')
 
+# 弱参照ハンドラーが参照先の回収済みを示す戻り値（受け取ったバスは購読を破棄する）
+HANDLER_EXPIRED = object()
+
 
 class EventPriority(Enum):
     """イベント優先順位"""
@@ -119,6 +122,18 @@ class RecordingStoppedEvent(Event):
         self.source = "recording_service"
 
 
+@dataclass
+class RecordingProgressEvent(Event):
+    """記録進捗イベント（アクション追加ごとの差分情報）"""
+    recording_id: str = ""
+    action_count: int = 0
+    estimated_duration_ms: int = 0
+    
+    def __post_init__(self):
+        super().__post_init__()
+        self.source = "recording_service"
+
+
 @dataclass
 class PlaybackStartedEvent(Event):
     """再生開始イベント"""
@@ -297,6 +312,46 @@ class EventBus(IEventBus):
         
         return subscription.subscription_id
     
+    def subscribe_many(self, handlers: Dict[Type[Event], EventHandler],
+                       priority: EventPriority = EventPriority.NORMAL) -> List[str]:
+        """
+        複数のイベントハンドラーを一括登録
+        
+        ロックの取得と優先度順の並べ替えは登録先のイベントタイプごとに1回で済みます。
+        
+        Args:
+            handlers: イベントタイプからハンドラーへの対応表
+            priority: ハンドラー優先度
+            
+        Returns:
+            購読IDのリスト（handlers の順序と同じ）
+        """
+        subscriptions = [
+            EventSubscription(
+                event_type=event_type,
+                handler=handler,
+                is_async=False,
+                priority=priority
+            )
+            for event_type, handler in handlers.items()
+        ]
+        
+        with self._lock:
+            touched = set()
+            for subscription in subscriptions:
+                self._subscriptions.setdefault(subscription.event_type, []).append(subscription)
+                touched.add(subscription.event_type)
+            
+            for event_type in touched:
+                self._subscriptions[event_type].sort(
+                    key=lambda s: s.priority.value, reverse=True
+                )
+        
+        for handler in handlers.values():
+            self._weak_refs.add(handler)
+        
+        return [subscription.subscription_id for subscription in subscriptions]
+    
     def subscribe_async(self, event_type: Type[Event], handler: AsyncEventHandler,
                        priority: EventPriority = EventPriority.NORMAL) -> str:
         """
@@ -347,6 +402,22 @@ class EventBus(IEventBus):
                         return True
         return False
     
+    def has_subscribers(self, event_type: Type[Event]) -> bool:
+        """
+        イベントタイプに購読者が存在するか判定
+        
+        Args:
+            event_type: 判定するイベントタイプ（継承元の購読も含む）
+            
+        Returns:
+            購読者が存在する場合True
+        """
+        with self._lock:
+            for registered_type, subscriptions in self._subscriptions.items():
+                if subscriptions and issubclass(event_type, registered_type):
+                    return True
+        return False
+    
     def publish(self, event: Event) -> Result[bool, ErrorInfo]:
         """
         イベントを発行（同期）
@@ -421,14 +492,26 @@ class EventBus(IEventBus):
         event_type = type(event)
         
         # 継承関係も考慮したハンドラー検索
-        matching_subscriptions = []
+        # ロック内では購読リストのスナップショット取得のみ行い、ハンドラーは
+        # ロック解放後に実行する（ハンドラー内での購読・解除を安全にするため）
+        matched_lists = []
         with self._lock:
             for registered_type, subscriptions in self._subscriptions.items():
-                if issubclass(event_type, registered_type):
-                    matching_subscriptions.extend(subscriptions)
+                if subscriptions and issubclass(event_type, registered_type):
+                    matched_lists.append(tuple(subscriptions))
         
-        # 優先度順に実行
-        matching_subscriptions.sort(key=lambda s: s.priority.value, reverse=True)
+        if not matched_lists:
+            return
+        
+        # 各購読リストは登録時に優先度順でソート済みのため、
+        # 複数タイプにマッチした場合のみ再ソートする
+        if len(matched_lists) == 1:
+            matching_subscriptions = matched_lists[0]
+        else:
+            matching_subscriptions = sorted(
+                (s for subs in matched_lists for s in subs),
+                key=lambda s: s.priority.value, reverse=True
+            )
         
         for subscription in matching_subscriptions:
             try:
@@ -446,8 +529,10 @@ class EventBus(IEventBus):
                     # 非同期ハンドラーは別スレッドで実行
                     self._executor.submit(self._run_async_handler, 
                                         subscription.handler, event)
-                else:
-                    subscription.handler(event)
+                elif subscription.handler(event) is HANDLER_EXPIRED:
+                    # 参照先が回収済みの弱参照ハンドラーは購読ごと破棄
+                    self.unsubscribe(subscription.subscription_id)
+                    continue
                 
                 subscription.executed_count += 1
                 self._stats["handlers_executed"] += 1
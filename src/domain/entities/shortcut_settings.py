@@ -17,6 +17,15 @@ class KeyModifier(Enum):
     WIN = "win"
 
 
+# 文字列表現での修飾キーの表示名（表示順）
+_MODIFIER_LABELS = (
+    (KeyModifier.CTRL, "Ctrl"),
+    (KeyModifier.ALT, "Alt"),
+    (KeyModifier.SHIFT, "Shift"),
+    (KeyModifier.WIN, "Win"),
+)
+
+
 @dataclass
 class KeyCombination:
     """キー組み合わせ定義"""
@@ -29,15 +38,8 @@ class KeyCombination:
         if not self.modifiers and not self.key:
             return ""
         
-        parts = []
-        if KeyModifier.CTRL in self.modifiers:
-            parts.append("Ctrl")
-        if KeyModifier.ALT in self.modifiers:
-            parts.append("Alt")
-        if KeyModifier.SHIFT in self.modifiers:
-            parts.append("Shift")
-        if KeyModifier.WIN in self.modifiers:
-            parts.append("Win")
+        modifiers = self.modifiers
+        parts = [label for modifier, label in _MODIFIER_LABELS if modifier in modifiers]
         
         if self.key:
             parts.append(self.key)
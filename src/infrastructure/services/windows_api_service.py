@@ -5,11 +5,15 @@ Windows固有のシステムレベル操作を提供するサービスです。
 キーボード・マウス・ウィンドウ操作、プロセス管理等を行います。
 """
 
+import array
 import ctypes
 import ctypes.wintypes
+import struct
+import sys
 import threading
 import time
-from typing import List, Optional, Dict, Any, Tuple
+from ctypes import byref
+from typing import List, Optional, Dict, Any, Tuple, Callable
 from dataclasses import dataclass
 
 from ...core.result import Result, Ok, Err, ErrorInfo
@@ -35,22 +39,109 @@ class RECT(ctypes.Structure):
     ]
 
 
-class INPUT(ctypes.Structure):
-    """Windows INPUT 構造体"""
+class KEYBDINPUT(ctypes.Structure):
+    """Windows KEYBDINPUT 構造体"""
+
+    _fields_ = [
+        ("wVk", ctypes.wintypes.WORD),
+        ("wScan", ctypes.wintypes.WORD),
+        ("dwFlags", ctypes.wintypes.DWORD),
+        ("time", ctypes.wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),  # ULONG_PTR
+    ]
+
+
+class MOUSEINPUT(ctypes.Structure):
+    """Windows MOUSEINPUT 構造体"""
+
+    _fields_ = [
+        ("dx", ctypes.wintypes.LONG),
+        ("dy", ctypes.wintypes.LONG),
+        ("mouseData", ctypes.wintypes.DWORD),
+        ("dwFlags", ctypes.wintypes.DWORD),
+        ("time", ctypes.wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),  # ULONG_PTR
+    ]
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    """Windows HARDWAREINPUT 構造体"""
 
     _fields_ = [
-        ("type", ctypes.wintypes.DWORD),
-        (
-            "union",
-            ctypes.c_char * 24,
-        ),  # KEYBDINPUT, MOUSEINPUT, HARDWAREINPUTの最大サイズ
+        ("uMsg", ctypes.wintypes.DWORD),
+        ("wParamL", ctypes.wintypes.WORD),
+        ("wParamH", ctypes.wintypes.WORD),
     ]
 
 
+class _INPUT_UNION(ctypes.Union):
+    """INPUT 構造体の共用体部分"""
+
+    _fields_ = [("ki", KEYBDINPUT), ("mi", MOUSEINPUT), ("hi", HARDWAREINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    """Windows INPUT 構造体（x64: 40バイト、x86: 28バイト）"""
+
+    _anonymous_ = ("u",)
+    _fields_ = [("type", ctypes.wintypes.DWORD), ("u", _INPUT_UNION)]
+
+
+# SendInput バッチ用レイアウト（INPUT 構造体から導出）
+_INPUT_SIZE = ctypes.sizeof(INPUT)
+_INPUT_UNION_OFFSET = INPUT.u.offset
+_INPUT_BATCH_CAPACITY = 256
+_INPUT_KEYBOARD = 1
+_KEYEVENTF_KEYUP = 0x0002
+_INPUT_MOUSE = 0
+_MOUSEEVENTF_WHEEL = 0x0800
+# type, wVk, wScan, dwFlags, time（残りはゼロ埋め）
+_KEYBD_INPUT_STRUCT = struct.Struct(
+    f"<I{_INPUT_UNION_OFFSET - 4}xHHII{_INPUT_SIZE - _INPUT_UNION_OFFSET - 12}x"
+)
+# type, dx, dy, mouseData, dwFlags, time（残りはゼロ埋め）
+_MOUSE_INPUT_STRUCT = struct.Struct(
+    f"<I{_INPUT_UNION_OFFSET - 4}xiiiII{_INPUT_SIZE - _INPUT_UNION_OFFSET - 20}x"
+)
+
+# マウスボタン → (押下フラグ, 離上フラグ)
+_BUTTON_FLAGS = {
+    1: (0x0002, 0x0004),  # 左: MOUSEEVENTF_LEFTDOWN / LEFTUP
+    2: (0x0008, 0x0010),  # 右: MOUSEEVENTF_RIGHTDOWN / RIGHTUP
+    3: (0x0020, 0x0040),  # 中央: MOUSEEVENTF_MIDDLEDOWN / MIDDLEUP
+}
+
+# タスクバーの「すべてのウィンドウを最小化」コマンドID
+_TRAY_CMD_MINIMIZE_ALL = 419
+
+
+# EnumWindows コールバック型（型オブジェクトの生成は一度だけ行う）
+if sys.platform == "win32":
+    _ENUM_WINDOWS_PROC = ctypes.WINFUNCTYPE(
+        ctypes.wintypes.BOOL, ctypes.wintypes.HWND, ctypes.wintypes.LPARAM
+    )
+else:
+    _ENUM_WINDOWS_PROC = None
+
+
 @dataclass
 class WindowInformation:
     """ウィンドウ情報"""
 
+    # 列挙結果は大量に生成されるため __dict__ を持たせない
+    # （Python 3.9 対応のため dataclass(slots=True) ではなく明示的に定義）
+    __slots__ = (
+        "handle",
+        "title",
+        "class_name",
+        "process_id",
+        "process_name",
+        "rect",
+        "is_visible",
+        "is_minimized",
+        "is_maximized",
+    )
+
     handle: int
     title: str
     class_name: str
@@ -66,6 +157,8 @@ class WindowInformation:
 class SystemInfo:
     """システム情報"""
 
+    __slots__ = ("screen_width", "screen_height", "dpi_x", "dpi_y", "scale_factor")
+
     screen_width: int
     screen_height: int
     dpi_x: int
@@ -78,7 +171,9 @@ class WindowsApiService:
 
     def __init__(self, event_bus: Optional[IEventBus] = None):
         self._event_bus = event_bus
-        self._lock = threading.RLock()
+        # 可変状態（IME状態）のみを保護する。入力送信自体はOSの入力キューで
+        # 直列化されるためロック不要
+        self._state_lock = threading.Lock()
 
         # Windows API 関数の取得
         self._user32 = ctypes.windll.user32
@@ -88,9 +183,32 @@ class WindowsApiService:
         # システム情報の初期化
         self._system_info = self._get_system_info()
 
+        # DPIスケーリング係数（生成後は不変のため逆数も事前計算）
+        self._scale_factor = self._system_info.scale_factor
+        self._inv_scale_factor = 1.0 / self._scale_factor
+        # 100% 表示（最も一般的）では座標変換を省略する
+        self._needs_scaling = abs(self._scale_factor - 1.0) > 1e-6
+
         # IME状態管理
         self._ime_enabled = False
 
+        # ウィンドウ列挙用コールバック（libffiクロージャ生成は初回のみ）
+        self._enum_lock = threading.Lock()
+        self._enum_accumulator: List[WindowInformation] = []
+        # 文字列取得用バッファ（コールバックは _enum_lock 下で同期実行されるため共有可能）
+        self._title_buffer = ctypes.create_unicode_buffer(512)
+        self._class_buffer = ctypes.create_unicode_buffer(256)
+        self._enum_thunk = _ENUM_WINDOWS_PROC(self._enum_callback)
+        self._find_predicate: Optional[Callable[[int], bool]] = None
+        self._find_handle = 0
+        self._find_thunk = _ENUM_WINDOWS_PROC(self._find_callback)
+
+        # ウィンドウ一括最小化で成功した方法（初回成功時に記録）
+        self._minimize_strategy: Optional[Callable[[], bool]] = None
+
+        # SendInput 用バッファ（スレッドごとに1つを使い回す）
+        self._input_local = threading.local()
+
     def _get_system_info(self) -> SystemInfo:
         """システム情報を取得"""
         try:
@@ -137,33 +255,33 @@ class WindowsApiService:
     ) -> Result[None, str]:
         """キー入力を送信"""
         try:
-            with self._lock:
-                # 修飾キーの押下
-                if shift:
-                    self._send_key_down(WindowsKeys.VK_SHIFT)
-                if ctrl:
-                    self._send_key_down(WindowsKeys.VK_CONTROL)
-                if alt:
-                    self._send_key_down(WindowsKeys.VK_MENU)
-                if win:
-                    self._send_key_down(WindowsKeys.VK_LWIN)
-
-                # メインキーの押下・離上
-                self._send_key_down(key_code)
-                time.sleep(0.01)  # 短い待機
-                self._send_key_up(key_code)
-
-                # 修飾キーの離上（逆順）
-                if win:
-                    self._send_key_up(WindowsKeys.VK_LWIN)
-                if alt:
-                    self._send_key_up(WindowsKeys.VK_MENU)
-                if ctrl:
-                    self._send_key_up(WindowsKeys.VK_CONTROL)
-                if shift:
-                    self._send_key_up(WindowsKeys.VK_SHIFT)
+            # 修飾キーの押下
+            modifiers = []
+            if shift:
+                modifiers.append(WindowsKeys.VK_SHIFT)
+            if ctrl:
+                modifiers.append(WindowsKeys.VK_CONTROL)
+            if alt:
+                modifiers.append(WindowsKeys.VK_MENU)
+            if win:
+                modifiers.append(WindowsKeys.VK_LWIN)
+
+            events = [(modifier, 0) for modifier in modifiers]
+
+            # メインキーの押下・離上
+            events.append((key_code, 0))
+            events.append((key_code, _KEYEVENTF_KEYUP))
+
+            # 修飾キーの離上（逆順）
+            events.extend(
+                (modifier, _KEYEVENTF_KEYUP) for modifier in reversed(modifiers)
+            )
 
-                return Ok(None)
+            # 1回の SendInput で送信（OSが連続した入力として扱う）
+            if not self._send_key_events(events):
+                return Err("キー入力の送信に失敗しました")
+
+            return Ok(None)
 
         except Exception as e:
             return Err(f"キー入力送信エラー: {str(e)}")
@@ -171,13 +289,12 @@ class WindowsApiService:
     def send_text_input(self, text: str, use_ime: bool = True) -> Result[None, str]:
         """テキスト入力を送信"""
         try:
-            with self._lock:
-                if use_ime and self._contains_japanese_chars(text):
-                    # IME使用でのテキスト入力
-                    return self._send_text_with_ime(text)
-                else:
-                    # 直接Unicode文字送信
-                    return self._send_text_unicode(text)
+            if use_ime and self._contains_japanese_chars(text):
+                # IME使用でのテキスト入力
+                return self._send_text_with_ime(text)
+            else:
+                # 直接Unicode文字送信
+                return self._send_text_unicode(text)
 
         except Exception as e:
             return Err(f"テキスト入力エラー: {str(e)}")
@@ -192,28 +309,29 @@ class WindowsApiService:
     ) -> Result[None, str]:
         """マウス入力を送信"""
         try:
-            with self._lock:
-                # DPIスケーリング調整
-                scaled_x = int(x * self._system_info.scale_factor)
-                scaled_y = int(y * self._system_info.scale_factor)
-
-                # マウス移動
-                self._set_cursor_pos(scaled_x, scaled_y)
-                time.sleep(0.01)
-
-                if wheel_delta != 0:
-                    # ホイール操作
-                    self._send_mouse_wheel(wheel_delta)
-                else:
-                    # クリック操作
-                    if double_click:
-                        self._send_mouse_click(button)
-                        time.sleep(0.05)
-                        self._send_mouse_click(button)
-                    else:
-                        self._send_mouse_click(button)
+            # DPIスケーリング調整
+            if self._needs_scaling:
+                x = int(x * self._scale_factor)
+                y = int(y * self._scale_factor)
 
-                return Ok(None)
+            # マウス移動
+            self._set_cursor_pos(x, y)
+            time.sleep(0.01)
+
+            if wheel_delta != 0:
+                # ホイール操作
+                sent = self._send_mouse_wheel(wheel_delta)
+            else:
+                # クリック操作
+                sent = self._send_mouse_click(button)
+                if sent and double_click:
+                    time.sleep(0.05)
+                    sent = self._send_mouse_click(button)
+
+            if not sent:
+                return Err("マウス入力の送信に失敗しました")
+
+            return Ok(None)
 
         except Exception as e:
             return Err(f"マウス入力エラー: {str(e)}")
@@ -226,20 +344,9 @@ class WindowsApiService:
     ) -> Result[WindowInformation, str]:
         """ウィンドウを検索"""
         try:
-            windows = self.enumerate_windows()
-
-            for window in windows:
-                match = True
-
-                if title and title not in window.title:
-                    match = False
-                if class_name and class_name != window.class_name:
-                    match = False
-                if process_name and process_name not in window.process_name:
-                    match = False
-
-                if match:
-                    return Ok(window)
+            window = self._find_window_fast(title, class_name, process_name)
+            if window is not None:
+                return Ok(window)
 
             return Err("指定された条件のウィンドウが見つかりませんでした")
 
@@ -248,70 +355,112 @@ class WindowsApiService:
 
     def enumerate_windows(self) -> List[WindowInformation]:
         """すべてのウィンドウを列挙"""
-        windows = []
-
-        def enum_proc(hwnd, lParam):
-            if self._user32.IsWindow(hwnd) and self._user32.IsWindowVisible(hwnd):
-                try:
-                    # ウィンドウタイトル取得
-                    title_length = self._user32.GetWindowTextLengthW(hwnd)
-                    if title_length > 0:
-                        title_buffer = ctypes.create_unicode_buffer(title_length + 1)
-                        self._user32.GetWindowTextW(
-                            hwnd, title_buffer, title_length + 1
-                        )
-                        title = title_buffer.value
-                    else:
-                        title = ""
-
-                    # クラス名取得
-                    class_buffer = ctypes.create_unicode_buffer(256)
-                    self._user32.GetClassNameW(hwnd, class_buffer, 256)
-                    class_name = class_buffer.value
-
-                    # プロセス情報取得
-                    process_id = ctypes.wintypes.DWORD()
-                    self._user32.GetWindowThreadProcessId(
-                        hwnd, ctypes.byref(process_id)
-                    )
-
-                    # ウィンドウ矩形取得
-                    rect = RECT()
-                    self._user32.GetWindowRect(hwnd, ctypes.byref(rect))
-
-                    # ウィンドウ状態
-                    placement = ctypes.wintypes.WINDOWPLACEMENT()
-                    placement.length = ctypes.sizeof(placement)
-                    self._user32.GetWindowPlacement(hwnd, ctypes.byref(placement))
-
-                    window_info = WindowInformation(
-                        handle=hwnd,
-                        title=title,
-                        class_name=class_name,
-                        process_id=process_id.value,
-                        process_name="",  # プロセス名は別途取得が必要
-                        rect=(rect.left, rect.top, rect.right, rect.bottom),
-                        is_visible=self._user32.IsWindowVisible(hwnd),
-                        is_minimized=placement.showCmd == 2,  # SW_SHOWMINIMIZED
-                        is_maximized=placement.showCmd == 3,  # SW_SHOWMAXIMIZED
-                    )
-
-                    windows.append(window_info)
+        with self._enum_lock:
+            self._enum_accumulator = []
+            try:
+                self._user32.EnumWindows(self._enum_thunk, 0)
+            except Exception:
+                pass
 
-                except Exception:
-                    pass  # エラーは無視してスキップ
+            windows = self._enum_accumulator
+            self._enum_accumulator = []
+            return windows
 
+    def _find_window_fast(
+        self,
+        title: Optional[str],
+        class_name: Optional[str],
+        process_name: Optional[str],
+    ) -> Optional[WindowInformation]:
+        """条件に一致した時点で列挙を打ち切ってウィンドウを検索"""
+
+        def predicate(hwnd) -> bool:
+            # 条件の判定に必要な情報だけを取得する
+            if title:
+                length = self._user32.GetWindowTextW(hwnd, self._title_buffer, 512)
+                if title not in self._title_buffer[:length]:
+                    return False
+            if class_name:
+                length = self._user32.GetClassNameW(hwnd, self._class_buffer, 256)
+                if class_name != self._class_buffer[:length]:
+                    return False
+            if process_name:
+                # プロセス名は未取得（列挙結果の process_name は常に空）
+                return False
             return True
 
-        try:
-            EnumWindowsProc = ctypes.WINFUNCTYPE(
-                ctypes.wintypes.BOOL, ctypes.wintypes.HWND, ctypes.wintypes.LPARAM
-            )
-            self._user32.EnumWindows(EnumWindowsProc(enum_proc), 0)
-        except Exception:
-            pass
+        with self._enum_lock:
+            self._find_predicate = predicate
+            self._find_handle = 0
+            try:
+                self._user32.EnumWindows(self._find_thunk, 0)
+            except Exception:
+                pass
+            finally:
+                self._find_predicate = None
+
+            if not self._find_handle:
+                return None
+
+            # 一致した1件のみ完全な情報を構築
+            return self._get_window_information(self._find_handle)
 
-        return windows
+    def _find_callback(self, hwnd, lParam):
+        """EnumWindows コールバック（最初に一致したウィンドウで停止）"""
+        if self._user32.IsWindow(hwnd) and self._user32.IsWindowVisible(hwnd):
+            try:
+                if self._find_predicate(hwnd):
+                    self._find_handle = hwnd
+                    return False  # 列挙を終了
+            except Exception:
+                pass  # エラーは無視してスキップ
+
+        return True
+
+    def _enum_callback(self, hwnd, lParam):
+        """EnumWindows コールバック（可視ウィンドウを収集）"""
+        if self._user32.IsWindow(hwnd) and self._user32.IsWindowVisible(hwnd):
+            try:
+                self._enum_accumulator.append(self._get_window_information(hwnd))
+            except Exception:
+                pass  # エラーは無視してスキップ
+
+        return True
+
+    def _get_window_information(self, hwnd: int) -> WindowInformation:
+        """可視ウィンドウの情報を取得"""
+        # ウィンドウタイトル取得（長さ取得を省略し1回の呼び出しで取得）
+        title_length = self._user32.GetWindowTextW(hwnd, self._title_buffer, 512)
+        title = self._title_buffer[:title_length]
+
+        # クラス名取得
+        class_length = self._user32.GetClassNameW(hwnd, self._class_buffer, 256)
+        class_name = self._class_buffer[:class_length]
+
+        # プロセス情報取得
+        process_id = ctypes.wintypes.DWORD()
+        self._user32.GetWindowThreadProcessId(hwnd, byref(process_id))
+
+        # ウィンドウ矩形取得
+        rect = RECT()
+        self._user32.GetWindowRect(hwnd, byref(rect))
+
+        # ウィンドウ状態
+        placement = ctypes.wintypes.WINDOWPLACEMENT()
+        placement.length = ctypes.sizeof(placement)
+        self._user32.GetWindowPlacement(hwnd, byref(placement))
+
+        return WindowInformation(
+            handle=hwnd,
+            title=title,
+            class_name=class_name,
+            process_id=process_id.value,
+            process_name="",  # プロセス名は別途取得が必要
+            rect=(rect.left, rect.top, rect.right, rect.bottom),
+            is_visible=True,  # 可視ウィンドウのみ列挙済み
+            is_minimized=placement.showCmd == 2,  # SW_SHOWMINIMIZED
+            is_maximized=placement.showCmd == 3,  # SW_SHOWMAXIMIZED
+        )
 
     def activate_window(self, handle: int) -> Result[None, str]:
         """ウィンドウをアクティブ化"""
@@ -331,95 +480,81 @@ class WindowsApiService:
     def minimize_all_windows(self) -> Result[None, str]:
         """すべてのウィンドウを最小化"""
         try:
-            # 方法1: Shell.Application COM オブジェクトを使用（最も確実）
-            try:
-                import subprocess
-
-                result = subprocess.run(
-                    [
-                        "powershell",
-                        "-WindowStyle",
-                        "Hidden",
-                        "-Command",
-                        "(New-Object -comObject Shell.Application).minimizeall()",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-
-                if result.returncode == 0:
+            # 前回成功した方法があればそれを直接使用
+            if self._minimize_strategy is not None:
+                if self._minimize_strategy():
                     return Ok(None)
+                self._minimize_strategy = None  # 失敗したため再探索
 
-            except Exception:
-                pass  # 次の方法を試行
-
-            # 方法2: Windows + D キーを送信
-            try:
-                # Windows キーを押下
-                self._send_key_down(WindowsKeys.VK_LWIN)
-                time.sleep(0.01)
-
-                # D キーを押下・離上
-                self._send_key_down(ord("D"))
-                time.sleep(0.01)
-                self._send_key_up(ord("D"))
-
-                # Windows キーを離上
-                time.sleep(0.01)
-                self._send_key_up(WindowsKeys.VK_LWIN)
-
-                return Ok(None)
-
-            except Exception:
-                pass  # 次の方法を試行
-
-            # 方法3: pywin32を使用（利用可能な場合）
-            try:
-                import win32api
-                import win32con
+            strategies = (
+                self._minimize_via_shell_tray,  # 方法1: タスクバーへの「すべて最小化」コマンド
+                self._minimize_via_hotkey,  # 方法2: Windows + D キーを送信
+                self._minimize_via_pywin32,  # 方法3: pywin32を使用（利用可能な場合）
+                self._minimize_via_enumeration,  # 方法4: 手動でウィンドウを列挙して最小化
+            )
+            for strategy in strategies:
+                try:
+                    if strategy():
+                        self._minimize_strategy = strategy
+                        return Ok(None)
+                except Exception:
+                    pass  # 次の方法を試行
 
-                # Windows + D を送信してデスクトップを表示
-                win32api.keybd_event(win32con.VK_LWIN, 0, 0, 0)
-                win32api.keybd_event(ord("D"), 0, 0, 0)
-                win32api.keybd_event(ord("D"), 0, win32con.KEYEVENTF_KEYUP, 0)
-                win32api.keybd_event(win32con.VK_LWIN, 0, win32con.KEYEVENTF_KEYUP, 0)
+            return Err("すべてのウィンドウ最小化方法が失敗しました")
 
-                return Ok(None)
+        except Exception as e:
+            return Err(f"ウィンドウ最小化エラー: {str(e)}")
 
-            except ImportError:
-                pass  # pywin32が利用できない
-            except Exception:
-                pass
+    def _minimize_via_shell_tray(self) -> bool:
+        """タスクバーに「すべて最小化」コマンドを送信（サブプロセス不要）"""
+        tray_handle = self._user32.FindWindowW("Shell_TrayWnd", None)
+        if not tray_handle:
+            return False
+        return bool(
+            self._user32.PostMessageW(
+                tray_handle, WindowsMessages.WM_COMMAND, _TRAY_CMD_MINIMIZE_ALL, 0
+            )
+        )
 
-            # 方法4: 手動でウィンドウを列挙して最小化
-            try:
-                windows = self.enumerate_windows()
-                minimized_count = 0
-
-                for window in windows:
-                    # 表示されているウィンドウのみ対象
-                    if (
-                        window.is_visible
-                        and not window.is_minimized
-                        and window.title.strip()
-                        and window.handle != self._get_current_window_handle()
-                    ):
-
-                        # ウィンドウを最小化
-                        if self._user32.ShowWindow(window.handle, 6):  # SW_MINIMIZE
-                            minimized_count += 1
-
-                if minimized_count > 0:
-                    return Ok(None)
+    def _minimize_via_hotkey(self) -> bool:
+        """Windows キー + D を1回の SendInput で送信"""
+        return self.send_key_input(ord("D"), win=True).is_success()
 
-            except Exception:
-                pass
+    def _minimize_via_pywin32(self) -> bool:
+        """pywin32 経由で Windows + D を送信"""
+        try:
+            import win32api
+            import win32con
+        except ImportError:
+            return False  # pywin32が利用できない
+
+        # Windows + D を送信してデスクトップを表示
+        win32api.keybd_event(win32con.VK_LWIN, 0, 0, 0)
+        win32api.keybd_event(ord("D"), 0, 0, 0)
+        win32api.keybd_event(ord("D"), 0, win32con.KEYEVENTF_KEYUP, 0)
+        win32api.keybd_event(win32con.VK_LWIN, 0, win32con.KEYEVENTF_KEYUP, 0)
+        return True
+
+    def _minimize_via_enumeration(self) -> bool:
+        """ウィンドウを列挙して個別に最小化"""
+        windows = self.enumerate_windows()
+        current_handle = self._get_current_window_handle()
+        minimized_count = 0
+
+        for window in windows:
+            # 表示されているウィンドウのみ対象
+            if (
+                window.is_visible
+                and not window.is_minimized
+                and window.title.strip()
+                and window.handle != current_handle
+            ):
 
-            return Err("すべてのウィンドウ最小化方法が失敗しました")
+                # ウィンドウを最小化
+                if self._user32.ShowWindow(window.handle, 6):  # SW_MINIMIZE
+                    minimized_count += 1
 
-        except Exception as e:
-            return Err(f"ウィンドウ最小化エラー: {str(e)}")
+        return minimized_count > 0
 
     def minimize_window(self, handle: int) -> Result[None, str]:
         """指定されたウィンドウを最小化"""
@@ -474,21 +609,21 @@ class WindowsApiService:
             if width is None or height is None:
                 # 現在のサイズを取得
                 rect = RECT()
-                self._user32.GetWindowRect(handle, ctypes.byref(rect))
+                self._user32.GetWindowRect(handle, byref(rect))
                 if width is None:
                     width = rect.right - rect.left
                 if height is None:
                     height = rect.bottom - rect.top
 
             # DPIスケーリング調整
-            scaled_x = int(x * self._system_info.scale_factor)
-            scaled_y = int(y * self._system_info.scale_factor)
-            scaled_width = int(width * self._system_info.scale_factor)
-            scaled_height = int(height * self._system_info.scale_factor)
+            if self._needs_scaling:
+                scale_factor = self._scale_factor
+                x = int(x * scale_factor)
+                y = int(y * scale_factor)
+                width = int(width * scale_factor)
+                height = int(height * scale_factor)
 
-            success = self._user32.MoveWindow(
-                handle, scaled_x, scaled_y, scaled_width, scaled_height, True
-            )
+            success = self._user32.MoveWindow(handle, x, y, width, height, True)
 
             if success:
                 return Ok(None)
@@ -502,10 +637,12 @@ class WindowsApiService:
         """現在のカーソル位置を取得"""
         try:
             point = POINT()
-            if self._user32.GetCursorPos(ctypes.byref(point)):
+            if self._user32.GetCursorPos(byref(point)):
                 # DPIスケーリング逆調整
-                x = int(point.x / self._system_info.scale_factor)
-                y = int(point.y / self._system_info.scale_factor)
+                if not self._needs_scaling:
+                    return Ok((point.x, point.y))
+                x = int(point.x * self._inv_scale_factor)
+                y = int(point.y * self._inv_scale_factor)
                 return Ok((x, y))
             else:
                 return Err("カーソル位置の取得に失敗しました")
@@ -528,40 +665,77 @@ class WindowsApiService:
     def toggle_ime(self, enable: bool) -> Result[None, str]:
         """IMEの有効/無効を切り替え"""
         try:
-            if enable != self._ime_enabled:
-                # Alt + 漢字キーでIME切り替え
-                result = self.send_key_input(WindowsKeys.VK_KANJI, alt=True)
-                if result.is_success():
-                    self._ime_enabled = enable
-                    return Ok(None)
-                else:
-                    return result
+            with self._state_lock:
+                if enable != self._ime_enabled:
+                    # Alt + 漢字キーでIME切り替え
+                    result = self.send_key_input(WindowsKeys.VK_KANJI, alt=True)
+                    if result.is_success():
+                        self._ime_enabled = enable
+                        return Ok(None)
+                    else:
+                        return result
             return Ok(None)
 
         except Exception as e:
             return Err(f"IME切り替えエラー: {str(e)}")
 
     # プライベートメソッド
-    def _send_key_down(self, key_code: int):
-        """キー押下"""
-        self._user32.keybd_event(key_code, 0, 0, 0)
+    def _get_input_buffer(self) -> array.array:
+        """スレッド固有の SendInput バッファを取得"""
+        buffer = getattr(self._input_local, "buffer", None)
+        if buffer is None:
+            buffer = array.array("B", bytes(_INPUT_SIZE * _INPUT_BATCH_CAPACITY))
+            self._input_local.buffer = buffer
+        return buffer
+
+    def _send_key_events(self, events: List[Tuple[int, int]]) -> bool:
+        """キーイベント（仮想キーコード, フラグ）をまとめて送信"""
+        buffer = self._get_input_buffer()
+        pack_into = _KEYBD_INPUT_STRUCT.pack_into
+
+        for start in range(0, len(events), _INPUT_BATCH_CAPACITY):
+            chunk = events[start : start + _INPUT_BATCH_CAPACITY]
+            for index, (key_code, flags) in enumerate(chunk):
+                pack_into(
+                    buffer, index * _INPUT_SIZE, _INPUT_KEYBOARD, key_code, 0, flags, 0
+                )
+
+            if not self._flush_input_buffer(buffer, len(chunk)):
+                return False
+
+        return True
+
+    def _send_mouse_events(self, events: List[Tuple[int, int]]) -> bool:
+        """マウスイベント（フラグ, mouseData）をまとめて送信"""
+        buffer = self._get_input_buffer()
+        pack_into = _MOUSE_INPUT_STRUCT.pack_into
+
+        for index, (flags, mouse_data) in enumerate(events):
+            pack_into(
+                buffer, index * _INPUT_SIZE, _INPUT_MOUSE, 0, 0, mouse_data, flags, 0
+            )
 
-    def _send_key_up(self, key_code: int):
-        """キー離上"""
-        self._user32.keybd_event(key_code, 0, 2, 0)  # KEYEVENTF_KEYUP
+        return self._flush_input_buffer(buffer, len(events))
+
+    def _flush_input_buffer(self, buffer: array.array, count: int) -> bool:
+        """バッファ先頭の count 件を SendInput で送信"""
+        inputs = (INPUT * count).from_buffer(buffer)
+        return self._user32.SendInput(count, inputs, _INPUT_SIZE) == count
 
     def _send_text_unicode(self, text: str) -> Result[None, str]:
         """Unicode文字の直接送信"""
         try:
+            # 送信先ウィンドウは文字ごとではなく1回だけ取得
+            hwnd = self._user32.GetForegroundWindow()
+            if not hwnd:
+                return Ok(None)
+
+            post_message = self._user32.PostMessageW
+            wm_char = WindowsMessages.WM_CHAR
             for char in text:
-                char_code = ord(char)
                 # WM_CHARメッセージでUnicode文字を送信
-                hwnd = self._user32.GetForegroundWindow()
-                if hwnd:
-                    self._user32.PostMessageW(
-                        hwnd, WindowsMessages.WM_CHAR, char_code, 0
-                    )
-                time.sleep(0.001)  # 短い間隔
+                # （メッセージキューが順序を保証するため文字間の待機は不要）
+                post_message(hwnd, wm_char, ord(char), 0)
             return Ok(None)
         except Exception as e:
             return Err(f"Unicode文字送信エラー: {str(e)}")
@@ -605,24 +779,17 @@ class WindowsApiService:
         """カーソル位置設定"""
         self._user32.SetCursorPos(x, y)
 
-    def _send_mouse_click(self, button: int):
-        """マウスクリック送信"""
-        if button == 1:  # 左クリック
-            self._user32.mouse_event(0x0002, 0, 0, 0, 0)  # MOUSEEVENTF_LEFTDOWN
-            time.sleep(0.01)
-            self._user32.mouse_event(0x0004, 0, 0, 0, 0)  # MOUSEEVENTF_LEFTUP
-        elif button == 2:  # 右クリック
-            self._user32.mouse_event(0x0008, 0, 0, 0, 0)  # MOUSEEVENTF_RIGHTDOWN
-            time.sleep(0.01)
-            self._user32.mouse_event(0x0010, 0, 0, 0, 0)  # MOUSEEVENTF_RIGHTUP
-        elif button == 3:  # 中央クリック
-            self._user32.mouse_event(0x0020, 0, 0, 0, 0)  # MOUSEEVENTF_MIDDLEDOWN
-            time.sleep(0.01)
-            self._user32.mouse_event(0x0040, 0, 0, 0, 0)  # MOUSEEVENTF_MIDDLEUP
+    def _send_mouse_click(self, button: int) -> bool:
+        """マウスクリック送信（押下・離上を1回の SendInput で送信）"""
+        flags = _BUTTON_FLAGS.get(button)
+        if flags is None:
+            return True  # 未対応ボタンは無視
+        down, up = flags
+        return self._send_mouse_events([(down, 0), (up, 0)])
 
-    def _send_mouse_wheel(self, delta: int):
+    def _send_mouse_wheel(self, delta: int) -> bool:
         """マウスホイール送信"""
-        self._user32.mouse_event(0x0800, 0, 0, delta * 120, 0)  # MOUSEEVENTF_WHEEL
+        return self._send_mouse_events([(_MOUSEEVENTF_WHEEL, delta * 120)])
 
     def _contains_japanese_chars(self, text: str) -> bool:
         """日本語文字が含まれているかチェック"""
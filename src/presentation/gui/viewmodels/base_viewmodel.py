@@ -6,11 +6,19 @@ Base ViewModel - MVVMパターンの基盤クラス
 """
 
 import asyncio
+import logging
+import sys
+from collections import deque
+from contextlib import contextmanager
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Callable, Set
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
+import functools
+import itertools
+import threading
 import uuid
+import weakref
 
 try:
     from PySide6.QtCore import QObject, Signal
@@ -36,52 +44,138 @@ except ImportError:
         QT_AVAILABLE = False
 
 from ....core.result import Result, Ok, Err, ErrorInfo
-from ....core.event_bus import EventBus, Event, SystemEvent
+from ....core.event_bus import EventBus, Event, SystemEvent, get_event_bus, HANDLER_EXPIRED
+
+_logger = logging.getLogger(__name__)
 
 # Qt関連のエクスポート
 __all__ = ['BaseViewModel', 'Command', 'AsyncCommand', 'ViewModelError', 'NotificationMessage', 'PropertyChangedEventArgs', 'QObject', 'Signal']
 
 
-@dataclass
+# エラー・通知の保持上限（超過分は古いものから破棄）
+_MAX_ERRORS = 500
+_MAX_NOTIFICATIONS = 200
+
+# 大量に生成される値オブジェクトは不変かつ __slots__ 化する（slots 指定は Python 3.10 以降のみ対応）
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+_VALUE_OBJECT_OPTIONS = {"frozen": True, **_DATACLASS_SLOTS}
+
+
+# ID はプロセス内での識別にのみ使うため、起動時に一度だけ生成した接頭辞と連番で採番する
+_ID_PREFIX = uuid.uuid4().hex[:8]
+_error_counter = itertools.count(1)
+_message_counter = itertools.count(1)
+
+
+# タイムスタンプ生成（datetime.now と UTC を事前に束縛し、呼び出しごとの属性参照を省く）
+_utc_now = functools.partial(datetime.now, timezone.utc)
+
+# プロパティ変更イベントの生成（event_type を事前に束縛し、呼び出し側は system_info のみ渡す）
+_property_changed_event = functools.partial(SystemEvent, event_type='property_changed')
+_properties_changed_event = functools.partial(SystemEvent, event_type='properties_changed')
+
+
+def _next_error_id() -> str:
+    """エラーIDを採番"""
+    return f"{_ID_PREFIX}-e{next(_error_counter)}"
+
+
+def _next_message_id() -> str:
+    """通知メッセージIDを採番"""
+    return f"{_ID_PREFIX}-m{next(_message_counter)}"
+
+
+_SETTER_TEMPLATE = """\
+def _set_{name}(self, value, _name={name!r}):
+    old_value = self._{name}
+    if old_value != value:
+        self._{name} = value
+        self.notify_property_changed(_name, old_value, value)
+        return True
+    return False
+"""
+
+
+def _make_weak_handler(method: Callable) -> Callable:
+    """バインドメソッドを弱参照で保持するハンドラーを生成
+    
+    イベントバス等の登録先がViewModelを延命しないようにします。
+    参照先が回収済みの場合は何もせず HANDLER_EXPIRED を返し、イベントバスに
+    購読の破棄を促します。バインドメソッド以外はそのまま返します。
+    """
+    if getattr(method, '__self__', None) is None:
+        return method
+    ref = weakref.WeakMethod(method)
+    
+    def handler(*args, **kwargs):
+        target = ref()
+        if target is None:
+            return HANDLER_EXPIRED
+        return target(*args, **kwargs)
+    
+    return handler
+
+
+def _make_setter(name: str) -> Callable[[Any, Any], bool]:
+    """プロパティ専用のセッターを生成
+    
+    名前が固定のプロパティについて、set_property の辞書経由の処理を介さず
+    ``self._<name>`` を直接比較・更新して変更を通知する関数を生成します。
+    """
+    if not name.isidentifier():
+        raise ValueError(f"無効なプロパティ名です: {name!r}")
+    
+    namespace: Dict[str, Any] = {}
+    exec(_SETTER_TEMPLATE.format(name=name), namespace)
+    setter = namespace[f"_set_{name}"]
+    setter.__qualname__ = f"BaseViewModel._set_{name}"
+    setter.__doc__ = f"{name} を設定し、変更があれば通知"
+    return setter
+
+
+@dataclass(**_VALUE_OBJECT_OPTIONS)
 class ViewModelError:
     """ViewModelエラー情報"""
-    error_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    error_id: str = field(default_factory=_next_error_id)
     message: str = ""
     details: Optional[str] = None
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = field(default_factory=_utc_now)
     error_type: str = "GENERAL"
-    is_handled: bool = False
 
 
-@dataclass
+@dataclass(**_VALUE_OBJECT_OPTIONS)
 class NotificationMessage:
     """通知メッセージ"""
-    message_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    message_id: str = field(default_factory=_next_message_id)
     title: str = ""
     message: str = ""
     notification_type: str = "INFO"  # INFO, WARNING, ERROR, SUCCESS
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = field(default_factory=_utc_now)
     duration_ms: int = 5000
     is_persistent: bool = False
 
 
+@dataclass(**_VALUE_OBJECT_OPTIONS)
 class PropertyChangedEventArgs:
     """プロパティ変更イベント引数"""
-    
-    def __init__(self, property_name: str, old_value: Any = None, new_value: Any = None):
-        self.property_name = property_name
-        self.old_value = old_value
-        self.new_value = new_value
-        self.timestamp = datetime.now(timezone.utc)
+    property_name: str
+    old_value: Any = None
+    new_value: Any = None
+    timestamp: datetime = field(default_factory=_utc_now)
 
 
 class Command:
     """コマンドパターンの実装"""
     
+    __slots__ = ('_execute_func', '_can_execute_func',
+                 '_can_execute_changed_handlers', '_can_execute_changed_handler_set')
+    
     def __init__(self, execute_func: Callable, can_execute_func: Optional[Callable] = None):
         self._execute_func = execute_func
         self._can_execute_func = can_execute_func or (lambda: True)
-        self._can_execute_changed_handlers = []
+        # 通知中の追加・削除に備え、変更時に作り直すタプルで保持する
+        self._can_execute_changed_handlers = ()
+        self._can_execute_changed_handler_set = set()  # 登録済み判定用
     
     def execute(self, parameter: Any = None):
         """コマンドを実行"""
@@ -94,28 +188,39 @@ class Command:
     
     def add_can_execute_changed_handler(self, handler: Callable):
         """実行可能状態変更ハンドラーを追加"""
-        self._can_execute_changed_handlers.append(handler)
+        if handler in self._can_execute_changed_handler_set:
+            return
+        self._can_execute_changed_handler_set.add(handler)
+        self._can_execute_changed_handlers = self._can_execute_changed_handlers + (handler,)
     
     def remove_can_execute_changed_handler(self, handler: Callable):
         """実行可能状態変更ハンドラーを削除"""
-        if handler in self._can_execute_changed_handlers:
-            self._can_execute_changed_handlers.remove(handler)
+        if handler not in self._can_execute_changed_handler_set:
+            return
+        self._can_execute_changed_handler_set.discard(handler)
+        self._can_execute_changed_handlers = tuple(
+            h for h in self._can_execute_changed_handlers if h != handler
+        )
     
     def notify_can_execute_changed(self):
         """実行可能状態の変更を通知"""
         for handler in self._can_execute_changed_handlers:
             try:
                 handler()
-            except Exception as e:
-                print(f"コマンド状態変更通知エラー: {e}")
+            except Exception:
+                _logger.exception("コマンド状態変更通知エラー")
 
 
 class AsyncCommand(Command):
     """非同期コマンドの実装"""
     
+    __slots__ = ('_is_executing', '_is_coroutine')
+    
     def __init__(self, execute_func: Callable, can_execute_func: Optional[Callable] = None):
         super().__init__(execute_func, can_execute_func)
         self._is_executing = False
+        # 実行関数は不変のため、コルーチン関数かどうかは生成時に一度だけ判定
+        self._is_coroutine = asyncio.iscoroutinefunction(execute_func)
     
     async def execute_async(self, parameter: Any = None):
         """非同期でコマンドを実行"""
@@ -126,7 +231,7 @@ class AsyncCommand(Command):
         self.notify_can_execute_changed()
         
         try:
-            if asyncio.iscoroutinefunction(self._execute_func):
+            if self._is_coroutine:
                 return await self._execute_func(parameter)
             else:
                 return self._execute_func(parameter)
@@ -139,247 +244,452 @@ class AsyncCommand(Command):
         return not self._is_executing and super().can_execute(parameter)
 
 
+class _BaseViewModelMixin(ABC):
+    """BaseViewModelの共通実装（Qt有無に依らない部分）"""
+    
+    # 専用セッター（_set_<name>）を生成する監視対象プロパティ
+    _observable_fields = ('is_busy', 'busy_message')
+    _make_setter = staticmethod(_make_setter)
+    _make_weak_handler = staticmethod(_make_weak_handler)
+    
+    def _initialize_base(self, event_bus: Optional[EventBus] = None):
+        """基底クラスの初期化"""
+        # 未指定時は生成せずグローバルのイベントバスを共有する
+        self._event_bus = event_bus if event_bus is not None else get_event_bus()
+        self._class_name = type(self).__name__  # イベント情報用（通知ごとの参照を省く）
+        self._property_changed_handlers = ()  # コピーオンライトのタプル
+        self._property_changed_handler_set = set()  # 登録済み判定用
+        self._synchronous_handlers = frozenset()
+        self._dispatch_loop = None
+        self._properties = {}
+        self._errors = deque(maxlen=_MAX_ERRORS)
+        self._errors_by_id = {}  # エラーID → エラー（O(1)検索用）
+        self._handled_error_ids = set()  # 処理済みエラーのID
+        self._notifications = deque(maxlen=_MAX_NOTIFICATIONS)
+        self._notifications_by_id = {}  # メッセージID → 通知（O(1)検索用）
+        self._is_busy = False
+        self._busy_message = ""
+        self._commands = {}
+        self._disposed = False
+        self._batch_depth = 0
+        self._batch_queue = []
+        # 以下の通知待ち・発行待ちはイベントバスのスレッドからも積まれるため _dispatch_lock で保護
+        self._dispatch_lock = threading.Lock()
+        self._pending_changes = {}  # 遅延ハンドラーへの通知待ち（プロパティ名 → [旧値, 新値]）
+        self._drain_scheduled = False
+        self._outbox = deque()  # イベントバスへの発行待ちイベント
+        self._outbox_scheduled = False
+        
+        # 共通コマンドの初期化
+        self._initialize_common_commands()
+    
+    def _initialize_common_commands(self):
+        """共通コマンドの初期化"""
+        self._commands.update({
+            'refresh': AsyncCommand(self._refresh_async, lambda: not self.is_busy),
+            'clear_errors': Command(self._clear_errors),
+            'clear_notifications': Command(self._clear_notifications)
+        })
+    
+    def add_property_changed_handler(self, handler: Callable[[PropertyChangedEventArgs], None],
+                                     synchronous: bool = False):
+        """プロパティ変更ハンドラーを追加
+        
+        Args:
+            handler: プロパティ変更ハンドラー
+            synchronous: Trueの場合は変更時に即座に呼び出す（既定ではイベントループ上で遅延実行）
+        """
+        if handler in self._property_changed_handler_set:
+            return
+        self._property_changed_handler_set.add(handler)
+        self._property_changed_handlers = self._property_changed_handlers + (handler,)
+        if synchronous:
+            self._synchronous_handlers = self._synchronous_handlers | {handler}
+    
+    def remove_property_changed_handler(self, handler: Callable[[PropertyChangedEventArgs], None]):
+        """プロパティ変更ハンドラーを削除"""
+        if handler not in self._property_changed_handler_set:
+            return
+        self._property_changed_handler_set.discard(handler)
+        self._property_changed_handlers = tuple(
+            h for h in self._property_changed_handlers if h != handler
+        )
+        self._synchronous_handlers = self._synchronous_handlers - {handler}
+    
+    def notify_property_changed(self, property_name: str, old_value: Any = None, new_value: Any = None):
+        """プロパティ変更を通知"""
+        if self._batch_depth:
+            # 一括更新中は終了時にまとめて通知
+            self._batch_queue.append((property_name, old_value, new_value))
+            return
+        
+        self._dispatch_property_changed(property_name, old_value, new_value)
+        
+        # イベントバスへの通知（購読者がいない場合はイベントを生成しない）
+        if not self._event_bus.has_subscribers(SystemEvent):
+            return
+        
+        self._post_event(_property_changed_event(system_info={
+            'view_model': self._class_name,
+            'property_name': property_name,
+            'old_value': old_value,
+            'new_value': new_value
+        }))
+    
+    def _dispatch_property_changed(self, property_name: str, old_value: Any, new_value: Any):
+        """プロパティ変更ハンドラーを呼び出す"""
+        handlers = self._property_changed_handlers
+        if not handlers:
+            return
+        
+        loop = self._get_dispatch_loop()
+        synchronous_handlers = self._synchronous_handlers
+        
+        if loop is None or synchronous_handlers:
+            args = PropertyChangedEventArgs(property_name, old_value, new_value)
+            for handler in handlers:
+                if loop is None or handler in synchronous_handlers:
+                    self._invoke_property_changed_handler(handler, args)
+        
+        if loop is None or len(synchronous_handlers) == len(handlers):
+            return
+        
+        # 遅延ハンドラーへの通知は変更プロパティ単位で集約し、
+        # イベントループの1ターンにつき1回だけまとめて呼び出す
+        with self._dispatch_lock:
+            change = self._pending_changes.get(property_name)
+            if change is None:
+                self._pending_changes[property_name] = [old_value, new_value]
+            else:
+                change[1] = new_value
+            
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        loop.call_soon_threadsafe(self._drain_property_changes)
+    
+    def _drain_property_changes(self):
+        """集約済みのプロパティ変更を遅延ハンドラーへ通知"""
+        # 取り出し前に解除し、処理中の変更は次のターンで通知する
+        with self._dispatch_lock:
+            self._drain_scheduled = False
+            changes, self._pending_changes = self._pending_changes, {}
+        
+        synchronous_handlers = self._synchronous_handlers
+        handlers = [h for h in self._property_changed_handlers if h not in synchronous_handlers]
+        if not handlers:
+            return
+        
+        for property_name, (old_value, new_value) in changes.items():
+            args = PropertyChangedEventArgs(property_name, old_value, new_value)
+            for handler in handlers:
+                self._invoke_property_changed_handler(handler, args)
+    
+    def _get_dispatch_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """ハンドラーの遅延実行に使うイベントループを取得（無ければNone）"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # ループ外のスレッドからの通知は、以前に捕捉したループへ送る
+            loop = self._dispatch_loop
+            if loop is None or loop.is_closed():
+                return None
+            return loop
+        
+        self._dispatch_loop = loop
+        return loop
+    
+    def _post_event(self, event: Event):
+        """イベントを発行待ちに積み、イベントループ上でまとめて発行"""
+        with self._dispatch_lock:
+            self._outbox.append(event)
+            if self._outbox_scheduled:
+                return
+            
+            loop = self._get_dispatch_loop()
+            if loop is not None:
+                self._outbox_scheduled = True
+        
+        if loop is None:
+            # ループが無い場合はその場で発行
+            self._drain_outbox()
+            return
+        
+        loop.call_soon_threadsafe(self._drain_outbox)
+    
+    def _drain_outbox(self):
+        """発行待ちイベントをイベントバスへ発行"""
+        # 取り出し前に解除し、処理中に積まれたイベントも取りこぼさない
+        with self._dispatch_lock:
+            self._outbox_scheduled = False
+        outbox = self._outbox
+        publish = self._event_bus.publish
+        while True:
+            try:
+                event = outbox.popleft()
+            except IndexError:
+                break  # 他のスレッドが先に取り出した場合も含めて空になった
+            publish(event)
+    
+    def _invoke_property_changed_handler(self, handler: Callable[[PropertyChangedEventArgs], None],
+                                         args: PropertyChangedEventArgs):
+        """プロパティ変更ハンドラーを実行"""
+        if self._disposed:
+            return
+        
+        try:
+            handler(args)
+        except Exception:
+            _logger.exception("プロパティ変更通知エラー")
+    
+    @contextmanager
+    def batch_notifications(self):
+        """プロパティ変更通知を一括化するコンテキスト
+        
+        ブロック内の変更はプロパティごとに1回へまとめ、終了時に通知します。
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_queue:
+                self._flush_batch_notifications()
+    
+    def _flush_batch_notifications(self):
+        """一括更新中に蓄積した変更を通知"""
+        queue, self._batch_queue = self._batch_queue, []
+        
+        # 同一プロパティの変更は最初の旧値と最後の新値に集約
+        changes: Dict[str, List[Any]] = {}
+        for property_name, old_value, new_value in queue:
+            change = changes.get(property_name)
+            if change is None:
+                changes[property_name] = [old_value, new_value]
+            else:
+                change[1] = new_value
+        
+        for property_name, (old_value, new_value) in changes.items():
+            self._dispatch_property_changed(property_name, old_value, new_value)
+        
+        if not self._event_bus.has_subscribers(SystemEvent):
+            return
+        
+        self._post_event(_properties_changed_event(system_info={
+            'view_model': self._class_name,
+            'changes': [
+                {'property_name': name, 'old_value': old_value, 'new_value': new_value}
+                for name, (old_value, new_value) in changes.items()
+            ]
+        }))
+    
+    def set_property(self, property_name: str, value: Any) -> bool:
+        """プロパティを設定し、変更があれば通知"""
+        old_value = self._properties.get(property_name)
+        
+        if old_value != value:
+            self._properties[property_name] = value
+            self.notify_property_changed(property_name, old_value, value)
+            return True
+        
+        return False
+    
+    def get_property(self, property_name: str, default_value: Any = None) -> Any:
+        """プロパティを取得"""
+        return self._properties.get(property_name, default_value)
+    
+    @property
+    def is_busy(self) -> bool:
+        """ビジー状態かどうか"""
+        return self._is_busy
+    
+    @property
+    def busy_message(self) -> str:
+        """ビジーメッセージ"""
+        return self._busy_message
+    
+    def set_busy(self, is_busy: bool, message: str = ""):
+        """ビジー状態を設定"""
+        with self.batch_notifications():
+            self._set_is_busy(is_busy)
+            self._set_busy_message(message)
+    
+    @property
+    def errors(self) -> List[ViewModelError]:
+        """エラー一覧"""
+        return list(self._errors)
+    
+    @property
+    def has_errors(self) -> bool:
+        """未処理のエラーがあるかどうか"""
+        return len(self._errors) > len(self._handled_error_ids)
+    
+    @property
+    def notifications(self) -> List[NotificationMessage]:
+        """通知一覧"""
+        return list(self._notifications)
+    
+    def add_error(self, message: str, details: Optional[str] = None, error_type: str = "GENERAL"):
+        """エラーを追加"""
+        error = ViewModelError(message=message, details=details, error_type=error_type)
+        
+        # 上限到達時は最古のエラーが破棄されるため索引からも除く
+        if len(self._errors) == self._errors.maxlen:
+            evicted = self._errors[0]
+            del self._errors_by_id[evicted.error_id]
+            self._handled_error_ids.discard(evicted.error_id)
+        
+        self._errors.append(error)
+        self._errors_by_id[error.error_id] = error
+        self.notify_property_changed('errors')
+    
+    def handle_error(self, error_id: str) -> bool:
+        """エラーを処理済みにする"""
+        if error_id not in self._errors_by_id or error_id in self._handled_error_ids:
+            return False
+        
+        self._handled_error_ids.add(error_id)
+        self.notify_property_changed('errors')
+        return True
+    
+    def is_error_handled(self, error_id: str) -> bool:
+        """エラーが処理済みかどうか"""
+        return error_id in self._handled_error_ids
+    
+    def add_notification(self, title: str, message: str, notification_type: str = "INFO", duration_ms: int = 5000,
+                         is_persistent: bool = False):
+        """通知を追加"""
+        notification = NotificationMessage(
+            title=title,
+            message=message,
+            notification_type=notification_type,
+            duration_ms=duration_ms,
+            is_persistent=is_persistent
+        )
+        
+        # 上限到達時は最古の通知が破棄されるため索引からも除く
+        if len(self._notifications) == self._notifications.maxlen:
+            del self._notifications_by_id[self._notifications[0].message_id]
+        
+        self._notifications.append(notification)
+        self._notifications_by_id[notification.message_id] = notification
+        self.notify_property_changed('notifications')
+    
+    def remove_notification(self, message_id: str) -> bool:
+        """通知を削除"""
+        notification = self._notifications_by_id.pop(message_id, None)
+        if notification is None:
+            return False
+        
+        self._notifications.remove(notification)
+        self.notify_property_changed('notifications')
+        return True
+    
+    def clear_errors(self):
+        """エラーをクリア"""
+        self._errors.clear()
+        self._errors_by_id.clear()
+        self._handled_error_ids.clear()
+        self.notify_property_changed('errors')
+    
+    def _clear_errors(self, parameter: Any = None):
+        """エラークリアコマンド"""
+        self.clear_errors()
+    
+    def clear_notifications(self):
+        """通知をクリア"""
+        self._notifications.clear()
+        self._notifications_by_id.clear()
+        self.notify_property_changed('notifications')
+    
+    def _clear_notifications(self, parameter: Any = None):
+        """通知クリアコマンド"""
+        self.clear_notifications()
+    
+    def add_command(self, name: str, command: Command):
+        """コマンドを追加"""
+        self._commands[name] = command
+    
+    def get_command(self, name: str) -> Optional[Command]:
+        """コマンドを取得"""
+        return self._commands.get(name)
+    
+    def remove_command(self, name: str):
+        """コマンドを削除"""
+        if name in self._commands:
+            del self._commands[name]
+    
+    async def refresh_async(self, parameter: Any = None):
+        """リフレッシュ処理の公開メソッド"""
+        try:
+            self.set_busy(True, "更新中...")
+            await self._refresh_async(parameter)
+        except Exception as e:
+            self.add_error("更新エラー", str(e), "REFRESH_ERROR")
+        finally:
+            self.set_busy(False)
+    
+    # 抽象メソッド
+    @abstractmethod
+    async def initialize_async(self):
+        """非同期初期化（サブクラスで実装）"""
+        pass
+    
+    @abstractmethod
+    async def _refresh_async(self, parameter: Any = None):
+        """リフレッシュ処理（サブクラスで実装）"""
+        pass
+    
+    def dispose(self):
+        """リソースを破棄
+        
+        ファイナライザでの自動破棄は行わないため、所有者（View）が明示的に呼び出してください。
+        Qt環境では QObject.destroyed シグナルからも呼び出されます。
+        """
+        if self._disposed:
+            return
+        
+        self._disposed = True
+        self._property_changed_handlers = ()
+        self._property_changed_handler_set.clear()
+        self._synchronous_handlers = frozenset()
+        self._commands.clear()
+        self._errors.clear()
+        self._errors_by_id.clear()
+        self._handled_error_ids.clear()
+        self._notifications.clear()
+        self._notifications_by_id.clear()
+        
+        # 具象クラスでのリソース破棄をサポート
+        if hasattr(self, '_dispose_resources'):
+            self._dispose_resources()
+
+
+# 監視対象プロパティの専用セッターをクラス定義時に一度だけ生成
+for _field_name in _BaseViewModelMixin._observable_fields:
+    setattr(_BaseViewModelMixin, f"_set_{_field_name}", _make_setter(_field_name))
+del _field_name
+
+
 # カスタムメタクラスでABCとQObjectの競合を解決
 if QT_AVAILABLE:
     class ViewModelMeta(type(ABC), type(QObject)):
         """BaseViewModel用のカスタムメタクラス"""
         pass
     
-    class BaseViewModel(ABC, QObject, metaclass=ViewModelMeta):
+    class BaseViewModel(_BaseViewModelMixin, QObject, metaclass=ViewModelMeta):
         """BaseViewModel - 全ViewModelの基底クラス"""
         
         def __init__(self, event_bus: Optional[EventBus] = None):
             """初期化"""
             QObject.__init__(self)
             self._initialize_base(event_bus)
-        
-        def _initialize_base(self, event_bus: Optional[EventBus] = None):
-            """基底クラスの初期化"""
-            self._event_bus = event_bus or EventBus()
-            self._property_changed_handlers = []
-            self._properties = {}
-            self._errors = []
-            self._notifications = []
-            self._is_busy = False
-            self._busy_message = ""
-            self._commands = {}
-            self._disposed = False
-            
-            # 共通コマンドの初期化
-            self._initialize_common_commands()
+            # ファイナライザ（__del__）は持たず、QObject破棄時に dispose() で後始末する
+            self.destroyed.connect(self.dispose)
 else:
-    class BaseViewModel(ABC):
+    class BaseViewModel(_BaseViewModelMixin):
         """BaseViewModel - 全ViewModelの基底クラス（Qt無し版）"""
         
         def __init__(self, event_bus: Optional[EventBus] = None):
             """初期化"""
             self._initialize_base(event_bus)
-        
-        def _initialize_base(self, event_bus: Optional[EventBus] = None):
-            """基底クラスの初期化"""
-            self._event_bus = event_bus or EventBus()
-            self._property_changed_handlers = []
-            self._properties = {}
-            self._errors = []
-            self._notifications = []
-            self._is_busy = False
-            self._busy_message = ""
-            self._commands = {}
-            self._disposed = False
-            
-            # 共通コマンドの初期化
-            self._initialize_common_commands()
-
-
-# BaseViewModelの共通メソッドを定義
-def _initialize_common_commands(self):
-    """共通コマンドの初期化"""
-    self._commands.update({
-        'refresh': AsyncCommand(self._refresh_async, lambda: not self.is_busy),
-        'clear_errors': Command(self._clear_errors),
-        'clear_notifications': Command(self._clear_notifications)
-    })
-
-def add_property_changed_handler(self, handler: Callable[[PropertyChangedEventArgs], None]):
-    """プロパティ変更ハンドラーを追加"""
-    self._property_changed_handlers.append(handler)
-
-def remove_property_changed_handler(self, handler: Callable[[PropertyChangedEventArgs], None]):
-    """プロパティ変更ハンドラーを削除"""
-    if handler in self._property_changed_handlers:
-        self._property_changed_handlers.remove(handler)
-
-def notify_property_changed(self, property_name: str, old_value: Any = None, new_value: Any = None):
-    """プロパティ変更を通知"""
-    args = PropertyChangedEventArgs(property_name, old_value, new_value)
-    
-    for handler in self._property_changed_handlers:
-        try:
-            handler(args)
-        except Exception as e:
-            print(f"プロパティ変更通知エラー: {e}")
-    
-    # イベントバスへの通知
-    event = SystemEvent(
-        event_type='property_changed',
-        system_info={
-            'view_model': self.__class__.__name__,
-            'property_name': property_name,
-            'old_value': old_value,
-            'new_value': new_value
-        }
-    )
-    self._event_bus.publish(event)
-
-def set_property(self, property_name: str, value: Any) -> bool:
-    """プロパティを設定し、変更があれば通知"""
-    old_value = self._properties.get(property_name)
-    
-    if old_value != value:
-        self._properties[property_name] = value
-        self.notify_property_changed(property_name, old_value, value)
-        return True
-    
-    return False
-
-def get_property(self, property_name: str, default_value: Any = None) -> Any:
-    """プロパティを取得"""
-    return self._properties.get(property_name, default_value)
-
-@property
-def is_busy(self) -> bool:
-    """ビジー状態かどうか"""
-    return self._is_busy
-
-@property
-def busy_message(self) -> str:
-    """ビジーメッセージ"""
-    return self._busy_message
-
-def set_busy(self, is_busy: bool, message: str = ""):
-    """ビジー状態を設定"""
-    if self.set_property('is_busy', is_busy):
-        self._is_busy = is_busy
-    
-    if self.set_property('busy_message', message):
-        self._busy_message = message
-
-@property
-def errors(self) -> List[ViewModelError]:
-    """エラー一覧"""
-    return self._errors.copy()
-
-@property
-def notifications(self) -> List[NotificationMessage]:
-    """通知一覧"""
-    return self._notifications.copy()
-
-def add_error(self, message: str, details: Optional[str] = None, error_type: str = "GENERAL"):
-    """エラーを追加"""
-    error = ViewModelError(message=message, details=details, error_type=error_type)
-    self._errors.append(error)
-    self.notify_property_changed('errors')
-
-def add_notification(self, title: str, message: str, notification_type: str = "INFO", duration_ms: int = 5000):
-    """通知を追加"""
-    notification = NotificationMessage(
-        title=title,
-        message=message,
-        notification_type=notification_type,
-        duration_ms=duration_ms
-    )
-    self._notifications.append(notification)
-    self.notify_property_changed('notifications')
-
-def clear_errors(self):
-    """エラーをクリア"""
-    self._errors.clear()
-    self.notify_property_changed('errors')
-
-def _clear_errors(self, parameter: Any = None):
-    """エラークリアコマンド"""
-    self.clear_errors()
-
-def clear_notifications(self):
-    """通知をクリア"""
-    self._notifications.clear()
-    self.notify_property_changed('notifications')
-
-def _clear_notifications(self, parameter: Any = None):
-    """通知クリアコマンド"""
-    self.clear_notifications()
-
-def add_command(self, name: str, command: Command):
-    """コマンドを追加"""
-    self._commands[name] = command
-
-def get_command(self, name: str) -> Optional[Command]:
-    """コマンドを取得"""
-    return self._commands.get(name)
-
-def remove_command(self, name: str):
-    """コマンドを削除"""
-    if name in self._commands:
-        del self._commands[name]
-
-async def refresh_async(self, parameter: Any = None):
-    """リフレッシュ処理の公開メソッド"""
-    try:
-        self.set_busy(True, "更新中...")
-        await self._refresh_async(parameter)
-    except Exception as e:
-        self.add_error("更新エラー", str(e), "REFRESH_ERROR")
-    finally:
-        self.set_busy(False)
-
-# 抽象メソッド
-@abstractmethod
-async def initialize_async(self):
-    """非同期初期化（サブクラスで実装）"""
-    pass
-
-@abstractmethod
-async def _refresh_async(self, parameter: Any = None):
-    """リフレッシュ処理（サブクラスで実装）"""
-    pass
-
-def dispose(self):
-    """リソースを破棄"""
-    if self._disposed:
-        return
-    
-    self._disposed = True
-    self._property_changed_handlers.clear()
-    self._commands.clear()
-    self._errors.clear()
-    self._notifications.clear()
-    
-    # 具象クラスでのリソース破棄をサポート
-    if hasattr(self, '_dispose_resources'):
-        self._dispose_resources()
-
-# メソッドをBaseViewModelクラスに追加
-BaseViewModel._initialize_common_commands = _initialize_common_commands
-BaseViewModel.add_property_changed_handler = add_property_changed_handler
-BaseViewModel.remove_property_changed_handler = remove_property_changed_handler
-BaseViewModel.notify_property_changed = notify_property_changed
-BaseViewModel.set_property = set_property
-BaseViewModel.get_property = get_property
-BaseViewModel.is_busy = is_busy
-BaseViewModel.busy_message = busy_message
-BaseViewModel.set_busy = set_busy
-BaseViewModel.errors = errors
-BaseViewModel.notifications = notifications
-BaseViewModel.add_error = add_error
-BaseViewModel.add_notification = add_notification
-BaseViewModel.clear_errors = clear_errors
-BaseViewModel._clear_errors = _clear_errors
-BaseViewModel.clear_notifications = clear_notifications
-BaseViewModel._clear_notifications = _clear_notifications
-BaseViewModel.add_command = add_command
-BaseViewModel.get_command = get_command
-BaseViewModel.remove_command = remove_command
-BaseViewModel.refresh_async = refresh_async
-BaseViewModel.initialize_async = initialize_async
-BaseViewModel._refresh_async = _refresh_async
-BaseViewModel.dispose = dispose
\ No newline at end of file
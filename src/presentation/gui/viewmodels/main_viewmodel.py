@@ -6,25 +6,134 @@ Main ViewModel - メイン画面のViewModel
 グローバルな操作を提供します。
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, NamedTuple, Set
 from datetime import datetime, timezone
+import dataclasses
+from functools import cached_property, partial
 import asyncio
+import platform
+import sys
+
+import psutil
 
 from .base_viewmodel import BaseViewModel, AsyncCommand, Command
 from ....core.result import Result, Ok, Err, ErrorInfo
-from ....core.event_bus import EventBus
+from ....core.event_bus import (
+    EventBus, Event, SystemEvent,
+    RecordingStartedEvent, RecordingStoppedEvent, PlaybackStartedEvent, PlaybackCompletedEvent
+)
 from ....application.services.recording_application_service import RecordingApplicationService
 from ....application.services.playback_application_service import PlaybackApplicationService
 from ....application.services.schedule_application_service import ScheduleApplicationService
-from ....application.dto.recording_dto import RecordingStatsDTO
+from ....application.dto.recording_dto import RecordingStatsDTO, CreateRecordingDTO
 from ....application.dto.playback_dto import PlaybackHistoryDTO
 from ....application.dto.schedule_dto import ScheduleStatsDTO
 from ....domain.entities.shortcut_settings import ShortcutSettings
+from ....shared.constants import APP_VERSION
+
+
+# 実行中に変わらないため、OS判定とディスク使用率の取得対象はモジュール読み込み時に決定
+_IS_WINDOWS = platform.system() == 'Windows'
+_SYSTEM_DRIVE = 'C:\\' if _IS_WINDOWS else '/'
+
+# 通知種別と頻出する通知タイトル（購読側の辞書検索で同一オブジェクトとして扱えるよう intern）
+_INFO = sys.intern("INFO")
+_SUCCESS = sys.intern("SUCCESS")
+_ERROR = sys.intern("ERROR")
+_WARNING = sys.intern("WARNING")
+_NAV_TITLE = sys.intern("画面遷移")
+
+_UTC = timezone.utc
+
+# アプリケーション終了要求イベントの生成（event_type を事前に束縛）
+_exit_requested_event = partial(SystemEvent, event_type=sys.intern('application_exit_requested'))
+
+
+class RecentRecording(NamedTuple):
+    """ダッシュボードに表示する最近の記録"""
+    id: str
+    name: str
+    created_at: datetime
+    action_count: int
+    status: str
+
+
+class ActiveSchedule(NamedTuple):
+    """ダッシュボードに表示するアクティブなスケジュール"""
+    id: str
+    name: str
+    next_execution: Optional[datetime]
+    execution_count: int
+    success_rate: float
+
+
+class _LifecycleSpec(NamedTuple):
+    """ライフサイクルイベントの処理内容"""
+    app_status: str
+    title: str
+    message: str  # イベントの属性名で埋める書式
+    notification_type: str
+    duration_ms: int = 5000
+    defaults: Optional[Dict[str, Any]] = None  # 属性が None の場合の書式用既定値
+    post_action: Optional[str] = None  # 通知後に呼び出すメソッド名
+    failure: Optional["_LifecycleSpec"] = None  # イベントの success が False の場合の処理内容
 
 
 class MainViewModel(BaseViewModel):
     """メイン画面ViewModel"""
     
+    # 変更通知に使うプロパティ名
+    _PROP_CURRENT_VIEW = 'current_view'
+    _PROP_APP_STATUS = 'app_status'
+    _PROP_SIDEBAR_EXPANDED = 'sidebar_expanded'
+    _PROP_SHORTCUT_SETTINGS = 'shortcut_settings'
+    _PROP_RECORDING_STATS = 'recording_stats'
+    _PROP_PLAYBACK_STATS = 'playback_stats'
+    _PROP_SCHEDULE_STATS = 'schedule_stats'
+    _PROP_RECENT_RECORDINGS = 'recent_recordings'
+    _PROP_ACTIVE_SCHEDULES = 'active_schedules'
+    _PROP_SYSTEM_INFO = 'system_info'
+    
+    # 機能利用可能性フラグの専用セッター（値が変わった場合のみ通知）
+    _set_is_recording_available = BaseViewModel._make_setter('is_recording_available')
+    _set_is_playback_available = BaseViewModel._make_setter('is_playback_available')
+    _set_is_schedule_available = BaseViewModel._make_setter('is_schedule_available')
+    
+    # バージョン情報の表示内容（実行中に変わらないためクラス定義時に生成）
+    _ABOUT_MESSAGE = (
+        f"EZRPA v{APP_VERSION}\n"
+        "クリーンアーキテクチャによるRPAアプリケーション\n"
+        "\n"
+        "開発: EZRPA Development Team\n"
+        "Copyright © 2025 All rights reserved."
+    )
+    
+    # 差分反映をこの回数続けたら統計情報を全件再読み込みして同期し直す
+    _STATS_RESYNC_INTERVAL = 10
+    
+    # イベント起因の再読み込みをまとめる待ち時間（秒）
+    _REFRESH_DELAY = 0.25
+    
+    # 読み込み時のサービス同時呼び出し数の上限
+    _MAX_CONCURRENT_SERVICE_CALLS = 4
+    
+    # 記録・再生のライフサイクルイベント（_on_lifecycle_event で共通処理）
+    _LIFECYCLE_EVENTS = {
+        RecordingStartedEvent: _LifecycleSpec(
+            "Recording", "記録開始", "記録「{recording_name}」を開始しました", _INFO,
+            post_action="_track_recording_started"),
+        RecordingStoppedEvent: _LifecycleSpec(
+            "Ready", "記録完了", "記録が完了しました ({action_count}件のアクション)", _SUCCESS,
+            post_action="_refresh_after_recording_completed"),
+        PlaybackStartedEvent: _LifecycleSpec(
+            "Playing", "再生開始", "再生を開始しました", _INFO),
+        PlaybackCompletedEvent: _LifecycleSpec(
+            "Ready", "再生完了", "再生が完了しました", _SUCCESS,
+            failure=_LifecycleSpec(
+                "Ready", "再生失敗", "再生が失敗しました: {error_message}", _ERROR, 8000,
+                defaults={'error_message': '不明なエラー'})),
+    }
+    
     def __init__(self, 
                  recording_service: RecordingApplicationService,
                  playback_service: PlaybackApplicationService,
@@ -53,7 +162,6 @@ class MainViewModel(BaseViewModel):
         
         # ビューモデル状態
         self._current_view = "dashboard"
-        self._app_version = "2.0.0"
         self._app_status = "Ready"
         self._recording_stats = None
         self._playback_stats = None
@@ -62,6 +170,14 @@ class MainViewModel(BaseViewModel):
         self._recent_playbacks = []
         self._active_schedules = []
         self._system_info = {}
+        self._stats_delta_count = 0  # 前回の全件読み込み以降に反映した差分の数
+        self._recordings_started_since_stats_load: Set[str] = set()  # 統計に未計上の記録ID
+        
+        # イベント起因の再読み込み（連続したイベントは1回の読み込みにまとめる）
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._pending_loaders: Dict[str, Any] = {}
+        # Python 3.9 ではセマフォが生成時のイベントループに束縛されるため、初回使用時にループ内で生成
+        self._service_semaphore: Optional[asyncio.Semaphore] = None
         
         # UI状態
         self._is_recording_available = True
@@ -69,10 +185,14 @@ class MainViewModel(BaseViewModel):
         self._is_schedule_available = True
         self._sidebar_expanded = True
         
+        # アップデート確認（サーバー問い合わせの実装までは無効）
+        self._update_check_enabled = False
+        
         # 初期化コマンド
         self._initialize_commands()
         
-        # イベント購読
+        # イベント購読（破棄時に解除するため購読IDを保持）
+        self._subscription_ids: List[str] = []
         self._subscribe_to_events()
     
     def _initialize_commands(self):
@@ -98,14 +218,15 @@ class MainViewModel(BaseViewModel):
     def _subscribe_to_events(self):
         """ドメインイベントの購読"""
         if self._event_bus:
-            # ショートカット設定更新イベントの購読
-            self._event_bus.subscribe("shortcut_settings_updated", self._on_shortcut_settings_updated)
+            # ハンドラーはバスの処理スレッドで呼ばれるため、ここで捕捉したループへ処理を送る
+            self._get_dispatch_loop()
             
-            # ホットキーサービスイベントの購読
-            self._event_bus.subscribe("hotkey_service_started", self._on_hotkey_service_started)
-            self._event_bus.subscribe("hotkey_service_stopped", self._on_hotkey_service_stopped)
-            self._event_bus.subscribe("custom_command_executed", self._on_custom_command_executed)
-            self._event_bus.subscribe("custom_command_error", self._on_custom_command_error)
+            # ライフサイクルイベントを弱参照で一括購読（バスがViewModelを延命しないように）
+            on_lifecycle_event = self._make_weak_handler(self._forward_lifecycle_event)
+            self._subscription_ids = self._event_bus.subscribe_many({
+                event_type: partial(on_lifecycle_event, spec=spec)
+                for event_type, spec in self._LIFECYCLE_EVENTS.items()
+            })
     
     # プロパティ
     @property
@@ -115,13 +236,13 @@ class MainViewModel(BaseViewModel):
     
     @current_view.setter
     def current_view(self, value: str):
-        if self.set_property('current_view', value):
+        if self.set_property(self._PROP_CURRENT_VIEW, value):
             self._current_view = value
     
-    @property
+    @cached_property
     def app_version(self) -> str:
-        """アプリケーションバージョン"""
-        return self._app_version
+        """アプリケーションバージョン（不変のため初回参照後はインスタンスに保持）"""
+        return APP_VERSION
     
     @property
     def app_status(self) -> str:
@@ -130,7 +251,7 @@ class MainViewModel(BaseViewModel):
     
     @app_status.setter
     def app_status(self, value: str):
-        if self.set_property('app_status', value):
+        if self.set_property(self._PROP_APP_STATUS, value):
             self._app_status = value
     
     @property
@@ -149,7 +270,7 @@ class MainViewModel(BaseViewModel):
         return self._schedule_stats
     
     @property
-    def recent_recordings(self) -> List[Dict[str, Any]]:
+    def recent_recordings(self) -> List[RecentRecording]:
         """最近の記録"""
         return self._recent_recordings
     
@@ -159,7 +280,7 @@ class MainViewModel(BaseViewModel):
         return self._recent_playbacks
     
     @property
-    def active_schedules(self) -> List[Dict[str, Any]]:
+    def active_schedules(self) -> List[ActiveSchedule]:
         """アクティブなスケジュール"""
         return self._active_schedules
     
@@ -185,7 +306,7 @@ class MainViewModel(BaseViewModel):
     
     @sidebar_expanded.setter
     def sidebar_expanded(self, value: bool):
-        if self.set_property('sidebar_expanded', value):
+        if self.set_property(self._PROP_SIDEBAR_EXPANDED, value):
             self._sidebar_expanded = value
     
     @property
@@ -202,7 +323,7 @@ class MainViewModel(BaseViewModel):
     def shortcut_settings(self, value):
         """ショートカット設定を更新"""
         self._shortcut_settings = value
-        self.notify_property_changed('shortcut_settings')
+        self.notify_property_changed(self._PROP_SHORTCUT_SETTINGS)
     
     # 初期化
     async def initialize_async(self):
@@ -210,20 +331,20 @@ class MainViewModel(BaseViewModel):
         try:
             self.set_busy(True, "アプリケーションを初期化中...")
             
-            # 統計情報の読み込み
-            await self._load_statistics_async()
-            
-            # 最近のデータの読み込み
-            await self._load_recent_data_async()
-            
-            # システム情報の読み込み
-            await self._load_system_info_async()
-            
-            # 機能利用可能性のチェック
-            await self._check_feature_availability_async()
+            # 統計情報・最近のデータ・システム情報・機能利用可能性は互いに独立しているため並行して読み込む
+            succeeded = await self._run_loaders_async(
+                "初期化エラー", "INITIALIZATION_ERROR",
+                self._load_statistics_async(),
+                self._load_recent_data_async(),
+                self._load_system_info_async(),
+                self._check_feature_availability_async()
+            )
             
-            self.app_status = "Ready"
-            self.add_notification("初期化完了", "アプリケーションの初期化が完了しました", "SUCCESS")
+            if succeeded:
+                self.app_status = "Ready"
+                self.add_notification("初期化完了", "アプリケーションの初期化が完了しました", _SUCCESS)
+            else:
+                self.app_status = "Error"
             
         except Exception as e:
             error_msg = f"初期化エラー: {str(e)}"
@@ -233,133 +354,199 @@ class MainViewModel(BaseViewModel):
         finally:
             self.set_busy(False)
     
+    async def _run_loaders_async(self, error_label: str, error_type: str, *loaders) -> bool:
+        """独立した読み込み処理を並行実行し、失敗したものをエラーとして登録
+        
+        Returns:
+            全ての読み込みが成功した場合True
+        """
+        results = await asyncio.gather(*loaders, return_exceptions=True)
+        
+        succeeded = True
+        cancelled = None
+        for result in results:
+            if isinstance(result, asyncio.CancelledError):
+                # 取り消しは失敗として登録せず、他の結果を処理した後に呼び出し元へ伝える
+                cancelled = result
+            elif isinstance(result, BaseException):
+                self.add_error(f"{error_label}: {str(result)}", str(result), error_type)
+                succeeded = False
+        if cancelled is not None:
+            raise cancelled
+        return succeeded
+    
+    def _schedule_refresh(self, loader):
+        """読み込み処理を遅延実行に登録
+        
+        待ち時間内に重なった要求は読み込み処理ごとに1回へまとめて実行します。
+        """
+        self._pending_loaders[loader.__name__] = loader
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._run_scheduled_refresh_async())
+    
+    async def _run_scheduled_refresh_async(self):
+        """登録済みの読み込み処理を待ち時間経過後にまとめて実行"""
+        await asyncio.sleep(self._REFRESH_DELAY)
+        
+        # 実行中に届いた要求は次回の実行として受け付ける
+        loaders, self._pending_loaders = self._pending_loaders, {}
+        self._refresh_task = None
+        await self._run_loaders_async(
+            "更新エラー", "REFRESH_ERROR", *(loader() for loader in loaders.values())
+        )
+    
+    async def _call_service_async(self, awaitable):
+        """サービス呼び出しを同時実行数の上限内で待機
+        
+        並行読み込みやイベント起因の再読み込みが重なっても、
+        サービスへの同時呼び出しが上限を超えないようにします。
+        """
+        if self._service_semaphore is None:
+            self._service_semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_SERVICE_CALLS)
+        async with self._service_semaphore:
+            return await awaitable
+    
     async def _load_statistics_async(self):
         """統計情報の読み込み"""
+        # 記録統計とスケジュール統計は別サービスのため並行して取得
+        recording_stats_result, schedule_stats_result = await asyncio.gather(
+            self._call_service_async(self._recording_service.get_statistics()),
+            self._call_service_async(self._schedule_service.get_statistics())
+        )
+        
         # 記録統計
-        recording_stats_result = await self._recording_service.get_statistics()
         if recording_stats_result.is_success():
             self._recording_stats = recording_stats_result.value
-            self.notify_property_changed('recording_stats')
+            self._stats_delta_count = 0
+            self._recordings_started_since_stats_load.clear()
+            self.notify_property_changed(self._PROP_RECORDING_STATS)
         else:
             self.handle_result_error(recording_stats_result, "記録統計の読み込み")
         
         # 再生統計
         playback_metrics = self._playback_service.get_performance_metrics()
         self._playback_stats = playback_metrics
-        self.notify_property_changed('playback_stats')
+        self.notify_property_changed(self._PROP_PLAYBACK_STATS)
         
         # スケジュール統計
-        schedule_stats_result = await self._schedule_service.get_statistics()
         if schedule_stats_result.is_success():
             self._schedule_stats = schedule_stats_result.value
-            self.notify_property_changed('schedule_stats')
+            self.notify_property_changed(self._PROP_SCHEDULE_STATS)
         else:
             self.handle_result_error(schedule_stats_result, "スケジュール統計の読み込み")
     
     async def _load_recent_data_async(self):
         """最近のデータの読み込み"""
+        # 最近の記録とアクティブなスケジュールは互いに独立しているため並行して取得
+        recent_recordings_result, active_schedules_result = await asyncio.gather(
+            self._call_service_async(self._recording_service.get_all_recordings(page=1, page_size=5)),
+            self._call_service_async(
+                self._schedule_service.get_all_schedules(active_only=True, page=1, page_size=10)
+            )
+        )
+        
         # 最近の記録
-        recent_recordings_result = await self._recording_service.get_all_recordings(page=1, page_size=5)
         if recent_recordings_result.is_success():
             recordings_list = recent_recordings_result.value
             self._recent_recordings = [
-                {
-                    'id': r.recording_id,
-                    'name': r.name,
-                    'created_at': r.created_at,
-                    'action_count': r.action_count,
-                    'status': r.status
-                }
-                for r in recordings_list.recordings
+                self._to_recent_recording(r) for r in recordings_list.recordings
             ]
-            self.notify_property_changed('recent_recordings')
+            self.notify_property_changed(self._PROP_RECENT_RECORDINGS)
         
         # アクティブなスケジュール
-        active_schedules_result = await self._schedule_service.get_all_schedules(active_only=True, page=1, page_size=10)
         if active_schedules_result.is_success():
             schedules_list = active_schedules_result.value
             self._active_schedules = [
-                {
-                    'id': s.schedule_id,
-                    'name': s.name,
-                    'next_execution': s.next_execution,
-                    'execution_count': s.execution_count,
-                    'success_rate': s.success_rate
-                }
+                ActiveSchedule(s.schedule_id, s.name, s.next_execution, s.execution_count, s.success_rate)
                 for s in schedules_list.schedules
             ]
-            self.notify_property_changed('active_schedules')
+            self.notify_property_changed(self._PROP_ACTIVE_SCHEDULES)
+    
+    @staticmethod
+    def _to_recent_recording(recording) -> RecentRecording:
+        """最近の記録の表示用データを作成"""
+        return RecentRecording(
+            recording.recording_id,
+            recording.name,
+            recording.created_at,
+            recording.action_count,
+            getattr(recording.status, 'value', recording.status)
+        )
     
     async def _load_system_info_async(self):
         """システム情報の読み込み"""
-        import platform
-        import psutil
-        
-        self._system_info = {
+        # psutil/platform の問い合わせはブロッキングのため、イベントループ外で実行
+        self._system_info = await asyncio.to_thread(self._collect_system_info_sync)
+        self.notify_property_changed(self._PROP_SYSTEM_INFO)
+    
+    def _collect_system_info_sync(self) -> Dict[str, Any]:
+        """システム情報を収集（同期）"""
+        memory = psutil.virtual_memory()
+        return {
             'platform': platform.platform(),
             'python_version': platform.python_version(),
             'cpu_count': psutil.cpu_count(),
-            'memory_total_gb': round(psutil.virtual_memory().total / (1024**3), 2),
-            'memory_available_gb': round(psutil.virtual_memory().available / (1024**3), 2),
-            'disk_usage_percent': psutil.disk_usage('/').percent if platform.system() != 'Windows' else psutil.disk_usage('C:\\').percent,
-            'app_version': self._app_version,
-            'startup_time': datetime.now(timezone.utc)
+            'memory_total_gb': round(memory.total / (1024**3), 2),
+            'memory_available_gb': round(memory.available / (1024**3), 2),
+            'disk_usage_percent': psutil.disk_usage(_SYSTEM_DRIVE).percent,
+            'app_version': self.app_version,
+            'startup_time': datetime.now(_UTC)
         }
-        self.notify_property_changed('system_info')
     
     async def _check_feature_availability_async(self):
         """機能利用可能性のチェック"""
-        # 記録機能のチェック（常に利用可能と仮定）
-        self._is_recording_available = True
-        
-        # 再生機能のチェック（記録が存在するかチェック）
-        recordings_result = await self._recording_service.get_all_recordings(page=1, page_size=1)
-        self._is_playback_available = recordings_result.is_success() and recordings_result.value.total_count > 0
-        
-        # スケジュール機能のチェック（スケジューラー状態をチェック）
-        self._is_schedule_available = self._schedule_service.is_scheduler_running()
+        # 再生機能のチェック（記録が存在するかを件数のみで確認）
+        has_recordings_result = await self._call_service_async(
+            self._recording_service.has_any_recordings()
+        )
         
-        self.notify_property_changed('is_recording_available')
-        self.notify_property_changed('is_playback_available')
-        self.notify_property_changed('is_schedule_available')
+        # 変化したフラグのみ通知
+        changed = self._set_is_recording_available(True)  # 記録機能は常に利用可能と仮定
+        changed |= self._set_is_playback_available(has_recordings_result.unwrap_or(False))
+        changed |= self._set_is_schedule_available(self._schedule_service.is_scheduler_running())
         
         # コマンドの実行可能状態を更新
-        self._update_commands_can_execute()
+        if changed:
+            self._update_commands_can_execute()
+    
+    def _update_commands_can_execute(self):
+        """機能利用可能性に依存するコマンドの実行可能状態変更を通知"""
+        command = self.get_command('quick_record')
+        if command:
+            command.notify_can_execute_changed()
     
     # ナビゲーションコマンド
     def _navigate_to_recording(self, parameter=None):
         """記録画面に遷移"""
         self.current_view = "recording"
-        self.add_notification("画面遷移", "記録画面に移動しました", "INFO", 2000)
+        self.add_notification(_NAV_TITLE, "記録画面に移動しました", _INFO, 2000)
     
     def _navigate_to_playback(self, parameter=None):
         """再生画面に遷移"""
         self.current_view = "playback"
-        self.add_notification("画面遷移", "再生画面に移動しました", "INFO", 2000)
+        self.add_notification(_NAV_TITLE, "再生画面に移動しました", _INFO, 2000)
     
     def _navigate_to_schedule(self, parameter=None):
         """スケジュール画面に遷移"""
         self.current_view = "schedule"
-        self.add_notification("画面遷移", "スケジュール画面に移動しました", "INFO", 2000)
+        self.add_notification(_NAV_TITLE, "スケジュール画面に移動しました", _INFO, 2000)
     
     def _navigate_to_settings(self, parameter=None):
         """設定画面に遷移"""
         self.current_view = "settings"
-        self.add_notification("画面遷移", "設定画面に移動しました", "INFO", 2000)
+        self.add_notification(_NAV_TITLE, "設定画面に移動しました", _INFO, 2000)
     
     def _navigate_to_dashboard(self, parameter=None):
         """ダッシュボードに遷移"""
         self.current_view = "dashboard"
-        self.add_notification("画面遷移", "ダッシュボードに移動しました", "INFO", 2000)
+        self.add_notification(_NAV_TITLE, "ダッシュボードに移動しました", _INFO, 2000)
     
     # 機能コマンド
     async def _quick_record_async(self, parameter=None):
         """クイック記録"""
         try:
-            from ....application.dto.recording_dto import CreateRecordingDTO
-            
             quick_recording_dto = CreateRecordingDTO(
-                name=f"クイック記録_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                name=f"クイック記録_{datetime.now():%Y%m%d_%H%M%S}",
                 description="メイン画面からのクイック記録",
                 category="quick",
                 tags=["quick", "main"],
@@ -373,7 +560,7 @@ class MainViewModel(BaseViewModel):
                 # 記録開始
                 start_result = await self._recording_service.start_recording(recording_id)
                 if start_result.is_success():
-                    self.add_notification("記録開始", "クイック記録を開始しました", "SUCCESS")
+                    self.add_notification("記録開始", "クイック記録を開始しました", _SUCCESS)
                     self.current_view = "recording"
                 else:
                     self.handle_result_error(start_result, "記録開始")
@@ -386,25 +573,33 @@ class MainViewModel(BaseViewModel):
     async def _stop_all_operations_async(self, parameter=None):
         """全ての操作を停止"""
         try:
-            stopped_operations = []
+            # 停止処理を並行実行し、所要時間を最も遅い停止処理に抑える
+            stop_tasks = {}
             
             # 実行中の記録を停止
             # (実装時に記録状態をチェックして停止)
             
             # 実行中の再生を停止
-            # (実装時に再生状態をチェックして停止)
+            stop_tasks["再生"] = self._playback_service.stop_all_playbacks()
             
             # スケジューラーを停止
             if self._schedule_service.is_scheduler_running():
-                stop_result = await self._schedule_service.stop_scheduler()
-                if stop_result.is_success():
-                    stopped_operations.append("スケジューラー")
+                stop_tasks["スケジューラー"] = self._schedule_service.stop_scheduler()
+            
+            results = await asyncio.gather(*stop_tasks.values(), return_exceptions=True)
+            stopped_operations = []
+            for label, stop_result in zip(stop_tasks, results):
+                if isinstance(stop_result, BaseException):
+                    self.add_error(f"{label}の停止エラー: {stop_result}",
+                                   str(stop_result), "STOP_OPERATIONS_ERROR")
+                elif stop_result.is_success() and stop_result.value:
+                    stopped_operations.append(label)
             
             if stopped_operations:
                 message = f"停止した操作: {', '.join(stopped_operations)}"
-                self.add_notification("操作停止", message, "INFO")
+                self.add_notification("操作停止", message, _INFO)
             else:
-                self.add_notification("操作停止", "停止すべき操作はありませんでした", "INFO")
+                self.add_notification("操作停止", "停止すべき操作はありませんでした", _INFO)
                 
         except Exception as e:
             self.add_error(f"操作停止エラー: {str(e)}", str(e), "STOP_OPERATIONS_ERROR")
@@ -415,24 +610,17 @@ class MainViewModel(BaseViewModel):
     
     def _show_about(self, parameter=None):
         """アプリケーション情報を表示"""
-        about_message = f"""
-EZRPA v{self.app_version}
-クリーンアーキテクチャによるRPAアプリケーション
-
-開発: EZRPA Development Team
-Copyright © 2025 All rights reserved.
-        """.strip()
-        
-        self.add_notification("バージョン情報", about_message, "INFO", 10000, True)
+        self.add_notification("バージョン情報", self._ABOUT_MESSAGE, _INFO, 10000, True)
     
     async def _check_updates_async(self, parameter=None):
         """アップデートをチェック"""
         try:
-            # 実装時にアップデートサーバーをチェック
-            await asyncio.sleep(2)  # 模擬的な処理時間
+            if self._update_check_enabled:
+                # TODO: アップデートサーバーへの問い合わせを実装
+                pass
             
             # 現在は最新バージョンと仮定
-            self.add_notification("アップデート確認", "現在のバージョンが最新です", "SUCCESS")
+            self.add_notification("アップデート確認", "現在のバージョンが最新です", _SUCCESS)
             
         except Exception as e:
             self.add_error(f"アップデート確認エラー: {str(e)}", str(e), "UPDATE_CHECK_ERROR")
@@ -445,12 +633,12 @@ Copyright © 2025 All rights reserved.
                 if self._event_bus:
                     self._event_bus.emit("shortcut_settings_updated", {
                         "settings": settings,
-                        "timestamp": datetime.now(timezone.utc)
+                        "timestamp": datetime.now(_UTC)
                     })
                 
-                self.add_notification("設定", "ショートカット設定が適用されました", "SUCCESS", 3000)
+                self.add_notification("設定", "ショートカット設定が適用されました", _SUCCESS, 3000)
             else:
-                self.add_notification("設定", "設定の適用をリクエストしました", "INFO", 2000)
+                self.add_notification("設定", "設定の適用をリクエストしました", _INFO, 2000)
                 
         except Exception as e:
             self.add_error("設定適用エラー", str(e), "SETTINGS_APPLICATION_ERROR")
@@ -464,17 +652,10 @@ Copyright © 2025 All rights reserved.
             # 設定を保存
             # (実装時に設定保存処理)
             
-            self.add_notification("終了処理", "アプリケーションを終了しています...", "INFO")
+            self.add_notification("終了処理", "アプリケーションを終了しています...", _INFO)
             
             # アプリケーション終了イベントを発行
-            from ....core.event_bus import SystemEvent
-            exit_event = SystemEvent(
-                event_type='application_exit_requested',
-                system_info={
-                    'timestamp': datetime.now(timezone.utc)
-                }
-            )
-            self._event_bus.publish(exit_event)
+            self._event_bus.publish(_exit_requested_event(system_info={'timestamp': datetime.now(_UTC)}))
             
         except Exception as e:
             self.add_error(f"終了処理エラー: {str(e)}", str(e), "EXIT_ERROR")
@@ -483,87 +664,128 @@ Copyright © 2025 All rights reserved.
     async def _refresh_async(self, parameter=None):
         """データをリフレッシュ"""
         try:
-            await self._load_statistics_async()
-            await self._load_recent_data_async()
-            await self._check_feature_availability_async()
+            succeeded = await self._run_loaders_async(
+                "リフレッシュエラー", "REFRESH_ERROR",
+                self._load_statistics_async(),
+                self._load_recent_data_async(),
+                self._check_feature_availability_async()
+            )
             
-            self.add_notification("リフレッシュ完了", "データを更新しました", "SUCCESS", 2000)
+            if succeeded:
+                self.add_notification("リフレッシュ完了", "データを更新しました", _SUCCESS, 2000)
             
         except Exception as e:
             self.add_error(f"リフレッシュエラー: {str(e)}", str(e), "REFRESH_ERROR")
     
     # イベントハンドラー
-    def _on_recording_started(self, event_data):
-        """記録開始イベントハンドラー"""
-        self.app_status = "Recording"
-        self.add_notification("記録開始", f"記録「{event_data.get('recording_name', '')}」を開始しました", "INFO")
-    
-    def _on_recording_completed(self, event_data):
-        """記録完了イベントハンドラー"""
-        self.app_status = "Ready"
-        self.add_notification("記録完了", f"記録「{event_data.get('recording_name', '')}」が完了しました", "SUCCESS")
-        # 統計情報を更新
-        asyncio.create_task(self._load_statistics_async())
-    
-    def _on_recording_failed(self, event_data):
-        """記録失敗イベントハンドラー"""
-        self.app_status = "Ready"
-        error_msg = event_data.get('error_message', '不明なエラー')
-        self.add_notification("記録失敗", f"記録が失敗しました: {error_msg}", "ERROR", 8000)
-    
-    def _on_playback_started(self, event_data):
-        """再生開始イベントハンドラー"""
-        self.app_status = "Playing"
-        self.add_notification("再生開始", f"記録「{event_data.get('recording_name', '')}」の再生を開始しました", "INFO")
-    
-    def _on_playback_completed(self, event_data):
-        """再生完了イベントハンドラー"""
-        self.app_status = "Ready"
-        success_rate = event_data.get('success_rate', 0)
-        self.add_notification("再生完了", f"再生が完了しました (成功率: {success_rate:.1%})", "SUCCESS")
-    
-    def _on_playback_failed(self, event_data):
-        """再生失敗イベントハンドラー"""
-        self.app_status = "Ready"
-        error_msg = event_data.get('error_message', '不明なエラー')
-        self.add_notification("再生失敗", f"再生が失敗しました: {error_msg}", "ERROR", 8000)
+    def _forward_lifecycle_event(self, event: Event, spec: "_LifecycleSpec"):
+        """ライフサイクルイベントをイベントループ上の _on_lifecycle_event へ引き渡す
+        
+        状態の更新や再読み込みの登録はループ上でしか行えないため、
+        バスの処理スレッドからは直接呼び出しません。
+        """
+        loop = self._get_dispatch_loop()
+        if loop is None:
+            return  # ループが無い（終了済み等）場合は処理できないため破棄
+        loop.call_soon_threadsafe(self._on_lifecycle_event, event, spec)
+    
+    def _on_lifecycle_event(self, event: Event, spec: "_LifecycleSpec"):
+        """記録・再生のライフサイクルイベントハンドラー（内容は _LIFECYCLE_EVENTS で定義）"""
+        if self._disposed:
+            return  # 破棄後に届いたイベントは無視
+        if spec.failure is not None and not getattr(event, 'success', True):
+            spec = spec.failure
+        self.app_status = spec.app_status
+        
+        # 書式はイベントの属性で埋め、値が None の属性は既定値を使う
+        values = dict(spec.defaults or {})
+        values.update((name, value) for name, value in vars(event).items() if value is not None)
+        message = spec.message.format_map(values)
+        self.add_notification(spec.title, message, spec.notification_type, spec.duration_ms)
+        if spec.post_action:
+            getattr(self, spec.post_action)(event)
+    
+    def _refresh_after_recording_completed(self, event: RecordingStoppedEvent):
+        """記録完了後の統計情報・最近の記録の更新"""
+        # 差分を反映できない場合のみ統計情報を全件再読み込み
+        if not self._apply_recording_completed(event):
+            self._schedule_refresh(self._load_statistics_async)
+        # イベントには一覧表示に必要な記録名等が含まれないため、最近の記録は再取得する
+        self._schedule_refresh(self._load_recent_data_async)
+    
+    def _track_recording_started(self, event: RecordingStartedEvent):
+        """統計情報の読み込み後に開始した記録を控える
+        
+        記録は作成と同時に開始されるため、開始イベントを作成の目安とします。
+        """
+        self._recordings_started_since_stats_load.add(event.recording_id)
+    
+    def _apply_recording_completed(self, event: RecordingStoppedEvent) -> bool:
+        """完了した記録の差分を統計情報に反映
+        
+        Returns:
+            反映した場合True（統計未読み込み、統計読み込み前から存在する記録、
+            または再同期の時期であればFalse）
+        """
+        stats = self._recording_stats
+        if stats is None or self._stats_delta_count >= self._STATS_RESYNC_INTERVAL:
+            self._stats_delta_count = 0
+            return False
+        
+        # 統計読み込み前から存在する記録は、どこまで計上済みか分からないため差分にしない
+        started = self._recordings_started_since_stats_load
+        if event.recording_id not in started:
+            return False
+        started.discard(event.recording_id)
+        self._stats_delta_count += 1
+        
+        # 統計はサービスのキャッシュと共有されているため、変更せずに新しいDTOへ置き換える
+        total_recordings = stats.total_recordings + 1
+        total_actions = stats.total_actions + event.action_count
+        self._recording_stats = dataclasses.replace(
+            stats,
+            total_recordings=total_recordings,
+            total_actions=total_actions,
+            avg_actions_per_recording=total_actions / total_recordings,
+            total_duration_seconds=stats.total_duration_seconds + event.duration_seconds
+        )
+        self.notify_property_changed(self._PROP_RECORDING_STATS)
+        return True
     
     def _on_schedule_activated(self, event_data):
         """スケジュールアクティブ化イベントハンドラー"""
-        self.add_notification("スケジュール", f"スケジュール「{event_data.get('schedule_name', '')}」がアクティブになりました", "INFO")
-        asyncio.create_task(self._load_recent_data_async())
+        self.add_notification("スケジュール", f"スケジュール「{event_data.get('schedule_name', '')}」がアクティブになりました", _INFO)
+        self._schedule_refresh(self._load_recent_data_async)
     
     def _on_schedule_execution_completed(self, event_data):
         """スケジュール実行完了イベントハンドラー"""
         success = event_data.get('success', False)
-        notification_type = "SUCCESS" if success else "ERROR"
+        notification_type = _SUCCESS if success else _ERROR
         message = "実行成功" if success else "実行失敗"
         self.add_notification("スケジュール実行", f"スケジュール「{event_data.get('schedule_name', '')}」: {message}", notification_type)
     
     def _on_scheduler_started(self, event_data):
         """スケジューラー開始イベントハンドラー"""
-        self._is_schedule_available = True
-        self.notify_property_changed('is_schedule_available')
-        self.add_notification("スケジューラー", "スケジューラーが開始されました", "SUCCESS")
+        self._set_is_schedule_available(True)
+        self.add_notification("スケジューラー", "スケジューラーが開始されました", _SUCCESS)
     
     def _on_scheduler_stopped(self, event_data):
         """スケジューラー停止イベントハンドラー"""
-        self._is_schedule_available = False
-        self.notify_property_changed('is_schedule_available')
+        self._set_is_schedule_available(False)
         reason = event_data.get('reason', 'user_request')
-        self.add_notification("スケジューラー", f"スケジューラーが停止されました (理由: {reason})", "INFO")
+        self.add_notification("スケジューラー", f"スケジューラーが停止されました (理由: {reason})", _INFO)
     
     def _on_shortcut_settings_updated(self, event_data):
         """ショートカット設定更新イベントハンドラー"""
-        self.add_notification("設定", "ショートカット設定が更新されました", "SUCCESS")
+        self.add_notification("設定", "ショートカット設定が更新されました", _SUCCESS)
     
     def _on_hotkey_service_started(self, event_data):
         """ホットキーサービス開始イベントハンドラー"""
-        self.add_notification("ホットキー", "グローバルホットキー監視を開始しました", "SUCCESS")
+        self.add_notification("ホットキー", "グローバルホットキー監視を開始しました", _SUCCESS)
     
     def _on_hotkey_service_stopped(self, event_data):
         """ホットキーサービス停止イベントハンドラー"""
-        self.add_notification("ホットキー", "グローバルホットキー監視を停止しました", "INFO")
+        self.add_notification("ホットキー", "グローバルホットキー監視を停止しました", _INFO)
     
     def _on_custom_command_executed(self, event_data):
         """カスタムコマンド実行イベントハンドラー"""
@@ -571,9 +793,9 @@ Copyright © 2025 All rights reserved.
         success = event_data.get('success', False)
         
         if success:
-            self.add_notification("コマンド実行", f"コマンド '{command_name}' を実行しました", "SUCCESS", 2000)
+            self.add_notification("コマンド実行", f"コマンド '{command_name}' を実行しました", _SUCCESS, 2000)
         else:
-            self.add_notification("コマンド実行", f"コマンド '{command_name}' の実行に失敗しました", "WARNING", 3000)
+            self.add_notification("コマンド実行", f"コマンド '{command_name}' の実行に失敗しました", _WARNING, 3000)
     
     def _on_custom_command_error(self, event_data):
         """カスタムコマンドエラーイベントハンドラー"""
@@ -584,8 +806,17 @@ Copyright © 2025 All rights reserved.
     # リソース破棄
     def _dispose_resources(self):
         """リソースの破棄"""
-        # Note: For demo purposes, simplified event cleanup
-        # In production, unsubscribe from EventBus using subscription IDs
+        # イベント購読の解除
+        if self._event_bus:
+            for subscription_id in self._subscription_ids:
+                self._event_bus.unsubscribe(subscription_id)
+        self._subscription_ids.clear()
+        
+        # 保留中の再読み込みを中止
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        self._pending_loaders.clear()
         
         # サービス参照のクリア
         self._recording_service = None
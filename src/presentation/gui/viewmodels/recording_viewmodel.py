@@ -8,11 +8,15 @@ Recording ViewModel - 記録機能のViewModel
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
+from collections import defaultdict
+from operator import attrgetter
 import asyncio
+import bisect
+import time
 
 from .base_viewmodel import BaseViewModel, AsyncCommand, Command
 from ....core.result import Result, Ok, Err, ErrorInfo
-from ....core.event_bus import EventBus
+from ....core.event_bus import EventBus, RecordingProgressEvent
 from ....application.services.recording_application_service import RecordingApplicationService
 from ....application.dto.recording_dto import (
     CreateRecordingDTO, UpdateRecordingDTO, RecordingDTO, 
@@ -22,9 +26,46 @@ from ....domain.entities.action import ActionTypes
 from ....domain.value_objects import RecordingStatus
 
 
+def _default_recording_name() -> str:
+    """名前未入力時の記録名（記録_YYYYMMDD_HHMMSS）を生成"""
+    now = datetime.now()
+    return (f"記録_{now.year:04d}{now.month:02d}{now.day:02d}"
+            f"_{now.hour:02d}{now.minute:02d}{now.second:02d}")
+
+
+def _name_sort_key(recording: RecordingDTO) -> str:
+    """名前順ソート用のキー（大文字小文字を区別しない）"""
+    return recording.name.lower()
+
+
 class RecordingViewModel(BaseViewModel):
     """記録機能ViewModel"""
     
+    # 検索クエリ入力後、検索を実行するまでの待ち時間（秒）
+    _SEARCH_DEBOUNCE_DELAY = 0.15
+    
+    # 入力項目のセッター（現在値と等しい場合は通知しない）
+    _set_search_query = BaseViewModel._make_setter('search_query')
+    _set_selected_category = BaseViewModel._make_setter('selected_category')
+    _set_selected_status = BaseViewModel._make_setter('selected_status')
+    _set_new_recording_name = BaseViewModel._make_setter('new_recording_name')
+    _set_new_recording_description = BaseViewModel._make_setter('new_recording_description')
+    _set_new_recording_category = BaseViewModel._make_setter('new_recording_category')
+    _set_new_recording_tags = BaseViewModel._make_setter('new_recording_tags')
+    _set_new_recording_auto_save = BaseViewModel._make_setter('new_recording_auto_save')
+    _set_action_count = BaseViewModel._make_setter('action_count')
+    _set_estimated_duration = BaseViewModel._make_setter('estimated_duration')
+    
+    # 統計情報キャッシュの有効期間（秒）
+    _STATS_CACHE_TTL = 30.0
+    
+    # ソート種別ごとのキー関数
+    _SORT_KEYS = {
+        "created_at": attrgetter("created_at"),
+        "name": _name_sort_key,
+        "action_count": attrgetter("action_count"),
+    }
+    
     def __init__(self, 
                  recording_service: RecordingApplicationService,
                  event_bus: Optional[EventBus] = None):
@@ -52,10 +93,16 @@ class RecordingViewModel(BaseViewModel):
         # 記録リスト
         self._recordings = []
         self._filtered_recordings = []
+        self._recordings_by_id: Dict[str, RecordingDTO] = {}
+        self._by_category: Dict[str, List[RecordingDTO]] = {}
+        self._by_status: Dict[str, List[RecordingDTO]] = {}
+        self._sorted_orders: Dict[tuple, List[RecordingDTO]] = {}
+        self._filtered_sort_keys: Optional[List[Any]] = None
         self._selected_recording = None
         self._total_recordings_count = 0
         self._current_page = 1
         self._page_size = 20
+        self._recompute_pagination()
         
         # 検索・フィルター
         self._search_query = ""
@@ -63,6 +110,14 @@ class RecordingViewModel(BaseViewModel):
         self._selected_status = "all"
         self._sort_by = "created_at"
         self._sort_descending = True
+        self._pending_search_task: Optional[asyncio.Task] = None
+        
+        # バックグラウンドで起動したタスク（GCされないよう参照を保持）
+        self._reload_task: Optional[asyncio.Task] = None
+        self._stats_task: Optional[asyncio.Task] = None
+        self._reload_again = False  # 読み込み中に再読み込みが要求されたか
+        self._stats_reload_again = False
+        self._background_tasks = set()
         
         # 新規記録用フォーム
         self._new_recording_name = ""
@@ -85,6 +140,7 @@ class RecordingViewModel(BaseViewModel):
         
         # 統計情報
         self._recording_stats = None
+        self._stats_cached_at: Optional[float] = None
         
         # イベント購読ID管理
         self._subscription_ids = []
@@ -164,7 +220,19 @@ class RecordingViewModel(BaseViewModel):
         """イベント購読"""
         # Note: For demo purposes, using simplified event handling
         # In production, these would be proper Event types and handled by EventBus
-        pass
+        
+        # 記録中のアクション数・推定時間は進捗イベントの差分で更新する
+        self._subscribe(RecordingProgressEvent, self._on_recording_progress)
+    
+    def _subscribe(self, event_type, handler):
+        """イベントを購読し、破棄時に解除できるよう購読IDを記録
+        
+        解除は _dispose_resources で行い、ハンドラーは破棄漏れに備えて弱参照で登録します。
+        """
+        if self._event_bus:
+            self._subscription_ids.append(
+                self._event_bus.subscribe(event_type, self._make_weak_handler(handler))
+            )
     
     # プロパティ
     @property
@@ -222,26 +290,6 @@ class RecordingViewModel(BaseViewModel):
         """総記録数"""
         return self._total_recordings_count
     
-    @property
-    def current_page(self) -> int:
-        """現在のページ"""
-        return self._current_page
-    
-    @property
-    def total_pages(self) -> int:
-        """総ページ数"""
-        return max(1, (self._total_recordings_count + self._page_size - 1) // self._page_size)
-    
-    @property
-    def has_next_page(self) -> bool:
-        """次のページがあるかどうか"""
-        return self._current_page < self.total_pages
-    
-    @property
-    def has_previous_page(self) -> bool:
-        """前のページがあるかどうか"""
-        return self._current_page > 1
-    
     @property
     def search_query(self) -> str:
         """検索クエリ"""
@@ -249,8 +297,8 @@ class RecordingViewModel(BaseViewModel):
     
     @search_query.setter
     def search_query(self, value: str):
-        if self.set_property('search_query', value):
-            self._search_query = value
+        if self._set_search_query(value):
+            self._schedule_search()
     
     @property
     def selected_category(self) -> str:
@@ -259,8 +307,7 @@ class RecordingViewModel(BaseViewModel):
     
     @selected_category.setter
     def selected_category(self, value: str):
-        if self.set_property('selected_category', value):
-            self._selected_category = value
+        self._set_selected_category(value)
     
     @property
     def selected_status(self) -> str:
@@ -269,8 +316,7 @@ class RecordingViewModel(BaseViewModel):
     
     @selected_status.setter
     def selected_status(self, value: str):
-        if self.set_property('selected_status', value):
-            self._selected_status = value
+        self._set_selected_status(value)
     
     # 新規記録フォームプロパティ
     @property
@@ -279,8 +325,7 @@ class RecordingViewModel(BaseViewModel):
     
     @new_recording_name.setter
     def new_recording_name(self, value: str):
-        if self.set_property('new_recording_name', value):
-            self._new_recording_name = value
+        self._set_new_recording_name(value)
     
     @property
     def new_recording_description(self) -> str:
@@ -288,8 +333,7 @@ class RecordingViewModel(BaseViewModel):
     
     @new_recording_description.setter
     def new_recording_description(self, value: str):
-        if self.set_property('new_recording_description', value):
-            self._new_recording_description = value
+        self._set_new_recording_description(value)
     
     @property
     def new_recording_category(self) -> str:
@@ -297,8 +341,7 @@ class RecordingViewModel(BaseViewModel):
     
     @new_recording_category.setter
     def new_recording_category(self, value: str):
-        if self.set_property('new_recording_category', value):
-            self._new_recording_category = value
+        self._set_new_recording_category(value)
     
     @property
     def show_new_recording_dialog(self) -> bool:
@@ -310,9 +353,31 @@ class RecordingViewModel(BaseViewModel):
     
     @property
     def recording_stats(self) -> Optional[RecordingStatsDTO]:
-        """記録統計"""
+        """記録統計
+        
+        未読み込み・無効化済み・有効期間切れの場合は読み込みを開始し、完了までは
+        保持中の値（未読み込みならNone）を返します。完了時に変更を通知します。
+        """
+        if self._is_statistics_stale():
+            self._ensure_statistics_loading()
         return self._recording_stats
     
+    def _is_statistics_stale(self) -> bool:
+        """統計情報の再取得が必要か（未読み込み・無効化済み・有効期間切れ）"""
+        return (self._stats_cached_at is None
+                or time.monotonic() - self._stats_cached_at >= self._STATS_CACHE_TTL)
+    
+    def _ensure_statistics_loading(self):
+        """統計情報の読み込みが未実行であればバックグラウンドで開始"""
+        if self._stats_task is not None and not self._stats_task.done():
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # イベントループ外では読み込みを開始しない
+            return
+        self._stats_task = self._spawn_background(self._run_statistics_loads(force=False))
+    
     # ページング関連プロパティ
     @property
     def current_page(self) -> int:
@@ -327,17 +392,26 @@ class RecordingViewModel(BaseViewModel):
     @property
     def total_pages(self) -> int:
         """総ページ数"""
-        return max(1, (self._total_recordings_count + self._page_size - 1) // self._page_size)
+        return self._total_pages
     
     @property
     def has_next_page(self) -> bool:
         """次のページがあるかどうか"""
-        return self._current_page < self.total_pages
+        return self._has_next_page
     
     @property
     def has_previous_page(self) -> bool:
         """前のページがあるかどうか"""
-        return self._current_page > 1
+        return self._has_previous_page
+    
+    def _recompute_pagination(self):
+        """総ページ数・前後ページ有無のキャッシュを更新
+        
+        総記録数、ページサイズ、現在のページのいずれかを変更した後に呼び出します。
+        """
+        self._total_pages = max(1, (self._total_recordings_count + self._page_size - 1) // self._page_size)
+        self._has_next_page = self._current_page < self._total_pages
+        self._has_previous_page = self._current_page > 1
     
     # 初期化
     async def initialize_async(self):
@@ -346,11 +420,9 @@ class RecordingViewModel(BaseViewModel):
             self.set_busy(True, "記録データを読み込み中...")
             
             # 記録リストの読み込み
+            # (統計情報は recording_stats の初回参照時に読み込む)
             await self._load_recordings_async()
             
-            # 統計情報の読み込み
-            await self._load_statistics_async()
-            
             self.add_notification("初期化完了", "記録機能の初期化が完了しました", "SUCCESS")
             
         except Exception as e:
@@ -369,16 +441,20 @@ class RecordingViewModel(BaseViewModel):
             if result.is_success():
                 recordings_list = result.value
                 self._recordings = recordings_list.recordings
+                self._rebuild_filter_indices()
                 self._total_recordings_count = recordings_list.total_count
+                self._recompute_pagination()
                 
-                # フィルター適用
-                await self._apply_current_filter()
-                
-                self.notify_property_changed('recordings')
-                self.notify_property_changed('total_recordings_count')
-                self.notify_property_changed('total_pages')
-                self.notify_property_changed('has_next_page')
-                self.notify_property_changed('has_previous_page')
+                # リスト関連の変更通知は一括で発行
+                with self.batch_notifications():
+                    # フィルター適用
+                    await self._apply_current_filter()
+                    
+                    self.notify_property_changed('recordings')
+                    self.notify_property_changed('total_recordings_count')
+                    self.notify_property_changed('total_pages')
+                    self.notify_property_changed('has_next_page')
+                    self.notify_property_changed('has_previous_page')
                 
             else:
                 self.handle_result_error(result, "記録リスト読み込み")
@@ -386,13 +462,21 @@ class RecordingViewModel(BaseViewModel):
         except Exception as e:
             self.add_error(f"記録リスト読み込みエラー: {str(e)}", str(e), "LOAD_RECORDINGS_ERROR")
     
-    async def _load_statistics_async(self):
-        """統計情報の読み込み"""
+    async def _load_statistics_async(self, force: bool = False):
+        """統計情報の読み込み
+        
+        Args:
+            force: Trueの場合はキャッシュの有効期間内でも再取得する
+        """
         try:
+            if not force and not self._is_statistics_stale():
+                return
+            
             result = await self._recording_service.get_statistics()
             
             if result.is_success():
                 self._recording_stats = result.value
+                self._stats_cached_at = time.monotonic()
                 self.notify_property_changed('recording_stats')
             else:
                 self.handle_result_error(result, "統計情報読み込み")
@@ -400,53 +484,54 @@ class RecordingViewModel(BaseViewModel):
         except Exception as e:
             self.add_error(f"統計情報読み込みエラー: {str(e)}", str(e), "LOAD_STATS_ERROR")
     
+    def _invalidate_statistics(self):
+        """統計情報キャッシュを無効化（次回読み込み時に再取得）"""
+        self._stats_cached_at = None
+    
     # 記録操作コマンド実装
     async def _start_new_recording_async(self, parameter=None):
         """新規記録開始"""
         try:
             # 新規記録DTOの作成
             create_dto = CreateRecordingDTO(
-                name=self._new_recording_name or f"記録_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                name=self._new_recording_name or _default_recording_name(),
                 description=self._new_recording_description,
                 category=self._new_recording_category,
-                tags=self._new_recording_tags.copy(),
+                tags=tuple(self._new_recording_tags),
                 auto_save=self._new_recording_auto_save
             )
             
-            # 記録作成
-            create_result = await self._recording_service.create_recording(create_dto)
-            if create_result.is_failure():
-                self.handle_result_error(create_result, "記録作成")
-                return
-            
-            recording_id = create_result.value
-            
-            # 記録開始
-            start_result = await self._recording_service.start_recording(recording_id)
-            if start_result.is_success():
-                self._current_recording_id = recording_id
+            # 記録の作成と開始（開始済みの記録情報を1回の呼び出しで取得）
+            result = await self._recording_service.create_and_start_recording(create_dto)
+            if result.is_success():
+                recording = result.value
+                self._invalidate_statistics()
+                
+                self._current_recording = recording
+                self._current_recording_id = recording.recording_id
                 self._is_recording = True
                 self._recording_status = "RECORDING"
-                self._action_count = 0
+                self._action_count = recording.action_count
                 self._recording_duration = 0.0
+                self._estimated_duration = recording.estimated_duration_ms / 1000.0
                 
-                self.notify_property_changed('is_recording')
-                self.notify_property_changed('recording_status')
-                self.notify_property_changed('action_count')
-                
-                self.add_notification("記録開始", f"記録「{create_dto.name}」を開始しました", "SUCCESS")
-                
-                # ダイアログを閉じる
-                self._hide_new_recording_dialog_command()
-                
-                # フォームをリセット
-                self._reset_new_recording_form()
-                
-                # 現在の記録情報を取得
-                await self._update_current_recording()
+                with self.batch_notifications():
+                    self.notify_property_changed('current_recording')
+                    self.notify_property_changed('is_recording')
+                    self.notify_property_changed('recording_status')
+                    self.notify_property_changed('action_count')
+                    self.notify_property_changed('estimated_duration')
+                    
+                    self.add_notification("記録開始", f"記録「{create_dto.name}」を開始しました", "SUCCESS")
+                    
+                    # ダイアログを閉じる
+                    self._hide_new_recording_dialog_command()
+                    
+                    # フォームをリセット
+                    self._reset_new_recording_form()
                 
             else:
-                self.handle_result_error(start_result, "記録開始")
+                self.handle_result_error(result, "記録開始")
                 
         except Exception as e:
             self.add_error(f"記録開始エラー: {str(e)}", str(e), "START_RECORDING_ERROR")
@@ -470,6 +555,7 @@ class RecordingViewModel(BaseViewModel):
                 self.notify_property_changed('recording_status')
                 self.notify_property_changed('current_recording')
                 
+                self._invalidate_statistics()
                 self.add_notification("記録停止", f"記録「{recording_dto.name}」を停止しました", "SUCCESS")
                 
                 # 記録リストを更新
@@ -516,9 +602,10 @@ class RecordingViewModel(BaseViewModel):
                 self._action_count = result.value.action_count
                 self._estimated_duration = result.value.estimated_duration_ms / 1000.0
                 
-                self.notify_property_changed('current_recording')
-                self.notify_property_changed('action_count')
-                self.notify_property_changed('estimated_duration')
+                with self.batch_notifications():
+                    self.notify_property_changed('current_recording')
+                    self.notify_property_changed('action_count')
+                    self.notify_property_changed('estimated_duration')
                 
         except Exception as e:
             self.add_error(f"現在記録更新エラー: {str(e)}", str(e), "UPDATE_CURRENT_RECORDING_ERROR")
@@ -536,13 +623,14 @@ class RecordingViewModel(BaseViewModel):
             result = await self._recording_service.delete_recording(recording_id)
             
             if result.is_success():
+                self._invalidate_statistics()
                 self.add_notification("削除完了", f"記録「{recording_name}」を削除しました", "SUCCESS")
                 
                 # 選択をクリア
                 self._clear_selection()
                 
-                # リストを再読み込み
-                await self._load_recordings_async()
+                # リストから除去（ページ構成が変わる場合は再読み込み）
+                await self._remove_recording_from_list_async(recording_id)
                 
             else:
                 self.handle_result_error(result, "記録削除")
@@ -562,8 +650,8 @@ class RecordingViewModel(BaseViewModel):
             duplicate_dto = CreateRecordingDTO(
                 name=f"{original_recording.name}_Copy",
                 description=f"Copy of {original_recording.description}",
-                category=original_recording.category,
-                tags=original_recording.tags,
+                category=original_recording.metadata.category,
+                tags=tuple(original_recording.metadata.tags),
                 auto_save=True
             )
             
@@ -574,10 +662,11 @@ class RecordingViewModel(BaseViewModel):
             
             if result.is_success():
                 new_recording_id = result.value
+                self._invalidate_statistics()
                 self.add_notification("複製完了", f"記録「{original_recording.name}」を複製しました", "SUCCESS")
                 
-                # リストを再読み込み
-                await self._load_recordings_async()
+                # リストに反映（ページ構成が変わる場合は再読み込み）
+                await self._add_recording_to_list_async(new_recording_id)
                 
                 # 新しい記録を選択
                 self._select_recording(new_recording_id)
@@ -620,7 +709,7 @@ class RecordingViewModel(BaseViewModel):
                 name=self._new_recording_name,
                 description=self._new_recording_description,
                 category=self._new_recording_category,
-                tags=self._new_recording_tags,
+                tags=tuple(self._new_recording_tags),
                 auto_save=self._new_recording_auto_save
             )
             
@@ -628,6 +717,7 @@ class RecordingViewModel(BaseViewModel):
             
             if result.is_success():
                 recording_id = result.value
+                self._invalidate_statistics()
                 self.add_notification("作成完了", f"記録「{create_dto.name}」を作成しました", "SUCCESS")
                 
                 # フォームをリセット
@@ -636,8 +726,8 @@ class RecordingViewModel(BaseViewModel):
                 # ダイアログを閉じる
                 self._hide_new_recording_dialog_command()
                 
-                # リストを再読み込み
-                await self._load_recordings_async()
+                # リストに反映（ページ構成が変わる場合は再読み込み）
+                await self._add_recording_to_list_async(recording_id)
                 
                 # 新しい記録を選択
                 self._select_recording(recording_id)
@@ -659,24 +749,26 @@ class RecordingViewModel(BaseViewModel):
                 return
             
             update_dto = UpdateRecordingDTO(
-                recording_id=self._selected_recording.recording_id,
                 name=self._edit_recording_name,
                 description=self._edit_recording_description,
                 category=self._edit_recording_category,
-                tags=self._edit_recording_tags
+                tags=tuple(self._edit_recording_tags)
             )
             
-            result = await self._recording_service.update_recording(update_dto)
+            result = await self._recording_service.update_recording(
+                self._selected_recording.recording_id, update_dto
+            )
             
             if result.is_success():
                 updated_recording = result.value
+                self._invalidate_statistics()
                 self.add_notification("更新完了", f"記録「{updated_recording.name}」を更新しました", "SUCCESS")
                 
                 # ダイアログを閉じる
                 self._hide_edit_recording_dialog_command()
                 
-                # リストを再読み込み
-                await self._load_recordings_async()
+                # リストの該当記録を差し替え
+                self._replace_recording_in_list(updated_recording)
                 
                 # 更新された記録を選択
                 self._select_recording(updated_recording.recording_id)
@@ -687,19 +779,82 @@ class RecordingViewModel(BaseViewModel):
         except Exception as e:
             self.add_error(f"記録更新エラー: {str(e)}", str(e), "UPDATE_RECORDING_ERROR")
     
+    async def _add_recording_to_list_async(self, recording_id: str):
+        """作成した記録を記録リストへ反映
+        
+        全件が1ページに収まる場合は記録のみを取得して差分で追加し、
+        それ以外はページ構成が変わるため再読み込みします。
+        """
+        if self._total_recordings_count + 1 > self._page_size:
+            await self._load_recordings_async()
+            return
+        
+        result = await self._recording_service.get_recording(recording_id, include_actions=False)
+        if result.is_failure():
+            await self._load_recordings_async()
+            return
+        
+        recording = result.value
+        self._recordings = self._recordings + [recording]
+        self._rebuild_filter_indices()
+        self._total_recordings_count += 1
+        self._recompute_pagination()
+        
+        with self.batch_notifications():
+            self._insert_filtered_recording(recording)
+            self.notify_property_changed('recordings')
+            self.notify_property_changed('total_recordings_count')
+    
+    async def _remove_recording_from_list_async(self, recording_id: str):
+        """削除した記録を記録リストから除去
+        
+        後続ページから記録が繰り上がる場合や、ページが空になる場合は
+        ページ構成が変わるため再読み込みします。
+        """
+        recording = self._recordings_by_id.get(recording_id)
+        if recording is None or self._has_next_page:
+            await self._load_recordings_async()
+            return
+        
+        if len(self._recordings) == 1 and self._current_page > 1:
+            # 最終ページが空になる場合は前のページへ移動
+            self._current_page -= 1
+            self._recompute_pagination()
+            await self._load_recordings_async()
+            return
+        
+        self._recordings = [r for r in self._recordings if r is not recording]
+        self._rebuild_filter_indices()
+        self._total_recordings_count -= 1
+        self._recompute_pagination()
+        
+        with self.batch_notifications():
+            self._remove_filtered_recording(recording)
+            self.notify_property_changed('recordings')
+            self.notify_property_changed('total_recordings_count')
+    
+    def _replace_recording_in_list(self, recording: RecordingDTO):
+        """記録リスト内の記録を更新後の内容に差し替え"""
+        previous = self._recordings_by_id.get(recording.recording_id)
+        if previous is None:
+            return
+        
+        self._recordings = [recording if r is previous else r for r in self._recordings]
+        self._rebuild_filter_indices()
+        
+        with self.batch_notifications():
+            self._remove_filtered_recording(previous)
+            self._insert_filtered_recording(recording)
+            self.notify_property_changed('recordings')
+    
     def _reset_new_recording_form(self, parameter=None):
         """新規記録フォームをリセット"""
-        self._new_recording_name = ""
-        self._new_recording_description = ""
-        self._new_recording_category = "general"
-        self._new_recording_tags = []
-        self._new_recording_auto_save = True
-        
-        self.notify_property_changed('new_recording_name')
-        self.notify_property_changed('new_recording_description')
-        self.notify_property_changed('new_recording_category')
-        self.notify_property_changed('new_recording_tags')
-        self.notify_property_changed('new_recording_auto_save')
+        with self.batch_notifications():
+            self._set_new_recording_name("")
+            self._set_new_recording_description("")
+            self._set_new_recording_category("general")
+            self._set_new_recording_tags([])
+            self._set_new_recording_auto_save(True)
     
     # 検索・フィルター実装
     async def _search_recordings_async(self, parameter=None):
@@ -720,7 +875,9 @@ class RecordingViewModel(BaseViewModel):
             if result.is_success():
                 recordings_list = result.value
                 self._recordings = recordings_list.recordings
+                self._rebuild_filter_indices()
                 self._total_recordings_count = recordings_list.total_count
+                self._recompute_pagination()
                 
                 await self._apply_current_filter()
                 
@@ -735,38 +892,227 @@ class RecordingViewModel(BaseViewModel):
         except Exception as e:
             self.add_error(f"検索エラー: {str(e)}", str(e), "SEARCH_ERROR")
     
+    def _schedule_search(self):
+        """検索を遅延実行に登録
+        
+        待ち時間内に続けて入力された場合は、保留中の検索を取り消して
+        最後の入力に対してのみ検索を実行します。
+        """
+        self._cancel_pending_search()
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # イベントループ外での設定時は検索を行わない
+            return
+        self._pending_search_task = asyncio.create_task(self._debounced_search_async())
+    
+    def _cancel_pending_search(self):
+        """保留中の検索を取り消し"""
+        if self._pending_search_task is not None and not self._pending_search_task.done():
+            self._pending_search_task.cancel()
+        self._pending_search_task = None
+    
+    async def _debounced_search_async(self):
+        """待ち時間経過後に検索を実行"""
+        try:
+            await asyncio.sleep(self._SEARCH_DEBOUNCE_DELAY)
+        except asyncio.CancelledError:
+            # 後続の入力で置き換えられた検索は破棄
+            return
+        self._pending_search_task = None
+        await self._search_recordings_async()
+    
     def _clear_search(self, parameter=None):
         """検索をクリア"""
         self.search_query = ""
-        asyncio.create_task(self._load_recordings_async())
+        self._cancel_pending_search()
+        self._schedule_reload()
+    
+    def _spawn_background(self, coro) -> asyncio.Task:
+        """完了まで参照を保持してバックグラウンドタスクを起動"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
+    def _schedule_reload(self):
+        """記録リストの再読み込みを起動
+        
+        読み込み中に要求された場合は完了後に1回だけ再実行し、
+        連続したイベントによる重複読み込みをまとめます。
+        """
+        if self._reload_task is not None and not self._reload_task.done():
+            self._reload_again = True
+            return
+        self._reload_task = self._spawn_background(self._run_recording_loads())
+    
+    async def _run_recording_loads(self):
+        """再読み込み要求がなくなるまで記録リストを読み込む"""
+        try:
+            await self._load_recordings_async()
+            while self._reload_again:
+                self._reload_again = False
+                await self._load_recordings_async()
+        finally:
+            self._reload_task = None
+    
+    def _schedule_statistics_reload(self):
+        """統計情報の再取得を起動（読み込み中の要求は完了後の1回にまとめる）"""
+        if self._stats_task is not None and not self._stats_task.done():
+            self._stats_reload_again = True
+            return
+        self._stats_task = self._spawn_background(self._run_statistics_loads(force=True))
+    
+    async def _run_statistics_loads(self, force: bool):
+        """再取得要求がなくなるまで統計情報を読み込む"""
+        try:
+            await self._load_statistics_async(force=force)
+            while self._stats_reload_again:
+                self._stats_reload_again = False
+                await self._load_statistics_async(force=True)
+        finally:
+            self._stats_task = None
     
     async def _apply_filter_async(self, parameter=None):
         """フィルター適用"""
         await self._apply_current_filter()
     
+    def _rebuild_filter_indices(self):
+        """ID別・カテゴリ別・状態別のインデックスを再構築"""
+        recordings_by_id = {}
+        by_category = defaultdict(list)
+        by_status = defaultdict(list)
+        for recording in self._recordings:
+            recordings_by_id[recording.recording_id] = recording
+            by_category[recording.metadata.category].append(recording)
+            by_status[recording.status].append(recording)
+        self._recordings_by_id = recordings_by_id
+        self._by_category = dict(by_category)
+        self._by_status = dict(by_status)
+        self._sorted_orders = {}
+        
+        # 選択中の記録は再取得後の同一IDの記録へ差し替える（ID索引で解決）
+        selected = self._selected_recording
+        if selected is not None:
+            current = recordings_by_id.get(selected.recording_id)
+            if current is not None and current is not selected:
+                self._selected_recording = current
+                self.notify_property_changed('selected_recording')
+    
+    def _get_sorted_order(self, sort_key) -> List[RecordingDTO]:
+        """現在のソート設定で並べた全記録リストを取得
+        
+        並び順は記録リストが差し替えられるまでソート設定ごとにキャッシュします。
+        """
+        cache_key = (self._sort_by, self._sort_descending)
+        order = self._sorted_orders.get(cache_key)
+        if order is None:
+            order = sorted(self._recordings, key=sort_key, reverse=self._sort_descending)
+            self._sorted_orders[cache_key] = order
+        return order
+    
     async def _apply_current_filter(self):
         """現在のフィルター設定を適用"""
-        filtered = self._recordings.copy()
-        
-        # カテゴリフィルター
-        if self._selected_category != "all":
-            filtered = [r for r in filtered if r.metadata.category == self._selected_category]
+        category = self._selected_category
+        status = self._selected_status
         
-        # ステータスフィルター
-        if self._selected_status != "all":
-            filtered = [r for r in filtered if r.status == self._selected_status]
+        # 元リストやバケットはコピーせず参照し、結果のリストは最後に1回だけ確保する
+        if category == "all" and status == "all":
+            source = self._recordings
+        elif status == "all":
+            # カテゴリフィルター
+            source = self._by_category.get(category, ())
+        elif category == "all":
+            # ステータスフィルター
+            source = self._by_status.get(status, ())
+        else:
+            # 小さい方のバケットを走査し、もう一方の条件はIDの集合で照合
+            smaller = self._by_category.get(category, ())
+            larger = self._by_status.get(status, ())
+            if len(smaller) > len(larger):
+                smaller, larger = larger, smaller
+            larger_ids = {r.recording_id for r in larger}
+            source = (r for r in smaller if r.recording_id in larger_ids)
         
         # ソート
-        if self._sort_by == "created_at":
-            filtered.sort(key=lambda r: r.created_at, reverse=self._sort_descending)
-        elif self._sort_by == "name":
-            filtered.sort(key=lambda r: r.name.lower(), reverse=self._sort_descending)
-        elif self._sort_by == "action_count":
-            filtered.sort(key=lambda r: r.action_count, reverse=self._sort_descending)
+        sort_key = self._SORT_KEYS.get(self._sort_by)
+        if sort_key is None:
+            filtered = list(source)
+        elif source is self._recordings:
+            # フィルターなしの場合はキャッシュ済みの並び順を再利用
+            filtered = list(self._get_sorted_order(sort_key))
+        else:
+            filtered = sorted(source, key=sort_key, reverse=self._sort_descending)
         
         self._filtered_recordings = filtered
+        self._filtered_sort_keys = None
+        self.notify_property_changed('filtered_recordings')
+    
+    def _matches_current_filter(self, recording: RecordingDTO) -> bool:
+        """記録が現在のフィルター条件に一致するか判定"""
+        category = self._selected_category
+        status = self._selected_status
+        return ((category == "all" or recording.metadata.category == category)
+                and (status == "all" or recording.status == status))
+    
+    def _bisect_filtered(self, key, right: bool) -> int:
+        """フィルター済みリスト上で、ソート順を保つキーの位置を二分探索で取得
+        
+        ソートキーの一覧は初回の差分更新時に作成し、フィルター再適用まで維持します。
+        """
+        keys = self._filtered_sort_keys
+        if keys is None:
+            sort_key = self._SORT_KEYS[self._sort_by]
+            keys = self._filtered_sort_keys = [sort_key(r) for r in self._filtered_recordings]
+        
+        if not self._sort_descending:
+            return bisect.bisect_right(keys, key) if right else bisect.bisect_left(keys, key)
+        
+        # 降順リスト用の二分探索
+        lo, hi = 0, len(keys)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if keys[mid] < key or (not right and keys[mid] == key):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+    
+    def _insert_filtered_recording(self, recording: RecordingDTO):
+        """フィルター済みリストへソート順を保って記録を挿入"""
+        if not self._matches_current_filter(recording):
+            return
+        
+        sort_key = self._SORT_KEYS.get(self._sort_by)
+        if sort_key is None:
+            self._filtered_recordings.append(recording)
+        else:
+            key = sort_key(recording)
+            index = self._bisect_filtered(key, right=True)
+            self._filtered_recordings.insert(index, recording)
+            self._filtered_sort_keys.insert(index, key)
         self.notify_property_changed('filtered_recordings')
     
+    def _remove_filtered_recording(self, recording: RecordingDTO):
+        """フィルター済みリストから記録を除去"""
+        sort_key = self._SORT_KEYS.get(self._sort_by)
+        if sort_key is None:
+            start = 0
+            end = len(self._filtered_recordings)
+        else:
+            # 同じソートキーを持つ範囲内のみを探索
+            key = sort_key(recording)
+            start = self._bisect_filtered(key, right=False)
+            end = self._bisect_filtered(key, right=True)
+        
+        for index in range(start, end):
+            if self._filtered_recordings[index].recording_id == recording.recording_id:
+                del self._filtered_recordings[index]
+                if self._filtered_sort_keys is not None:
+                    del self._filtered_sort_keys[index]
+                self.notify_property_changed('filtered_recordings')
+                return
+    
     async def _sort_recordings_async(self, parameter=None):
         """記録リストをソート"""
         await self._apply_current_filter()
@@ -777,18 +1123,21 @@ class RecordingViewModel(BaseViewModel):
         """次のページに移動"""
         if self.has_next_page:
             self._current_page += 1
+            self._recompute_pagination()
             await self._load_recordings_async()
     
     async def _previous_page_async(self, parameter=None):
         """前のページに移動"""
         if self.has_previous_page:
             self._current_page -= 1
+            self._recompute_pagination()
             await self._load_recordings_async()
     
     async def _go_to_page_async(self, parameter=None):
         """指定のページに移動"""
         if isinstance(parameter, int) and 1 <= parameter <= self.total_pages:
             self._current_page = parameter
+            self._recompute_pagination()
             await self._load_recordings_async()
     
     # ダイアログ制御
@@ -818,14 +1167,6 @@ class RecordingViewModel(BaseViewModel):
         self._show_edit_recording_dialog = False
         self.notify_property_changed('show_edit_recording_dialog')
     
-    def _reset_new_recording_form(self, parameter=None):
-        """新規記録フォームをリセット"""
-        self.new_recording_name = ""
-        self.new_recording_description = ""
-        self.new_recording_category = "general"
-        self._new_recording_tags = []
-        self._new_recording_auto_save = True
-    
     # 選択操作
     def _select_recording(self, parameter=None):
         """記録を選択"""
@@ -834,11 +1175,10 @@ class RecordingViewModel(BaseViewModel):
             self.notify_property_changed('selected_recording')
         elif isinstance(parameter, str):
             # recording_idで検索
-            for recording in self._recordings:
-                if recording.recording_id == parameter:
-                    self._selected_recording = recording
-                    self.notify_property_changed('selected_recording')
-                    break
+            recording = self._recordings_by_id.get(parameter)
+            if recording is not None:
+                self._selected_recording = recording
+                self.notify_property_changed('selected_recording')
     
     def _clear_selection(self, parameter=None):
         """選択をクリア"""
@@ -848,68 +1188,112 @@ class RecordingViewModel(BaseViewModel):
     # リフレッシュ処理
     async def _refresh_async(self, parameter=None):
         """データをリフレッシュ"""
-        await self._load_recordings_async()
-        await self._load_statistics_async()
+        loaders = [self._load_recordings_async(), self._load_statistics_async(force=True)]
         if self._current_recording_id:
-            await self._update_current_recording()
+            loaders.append(self._update_current_recording())
+        await asyncio.gather(*loaders)
     
     # イベントハンドラー
     def _on_recording_started(self, event_data):
         """記録開始イベント"""
+        if self._recording_service is None:
+            return  # 破棄後に届いたイベントは無視
         recording_id = event_data.get('recording_id')
         if recording_id == self._current_recording_id:
             self._is_recording = True
             self._recording_status = "RECORDING"
-            self.notify_property_changed('is_recording')
-            self.notify_property_changed('recording_status')
+            with self.batch_notifications():
+                self.notify_property_changed('is_recording')
+                self.notify_property_changed('recording_status')
     
     def _on_recording_stopped(self, event_data):
         """記録停止イベント"""
+        if self._recording_service is None:
+            return
         recording_id = event_data.get('recording_id')
         if recording_id == self._current_recording_id:
             self._is_recording = False
             self._recording_status = "STOPPED"
-            self.notify_property_changed('is_recording')
-            self.notify_property_changed('recording_status')
+            with self.batch_notifications():
+                self.notify_property_changed('is_recording')
+                self.notify_property_changed('recording_status')
     
     def _on_recording_completed(self, event_data):
         """記録完了イベント"""
+        if self._recording_service is None:
+            return
         recording_id = event_data.get('recording_id')
         if recording_id == self._current_recording_id:
-            asyncio.create_task(self._update_current_recording())
+            self._spawn_background(self._update_current_recording())
         
         # 統計情報を更新
-        asyncio.create_task(self._load_statistics_async())
+        self._schedule_statistics_reload()
     
     def _on_recording_failed(self, event_data):
         """記録失敗イベント"""
+        if self._recording_service is None:
+            return
         recording_id = event_data.get('recording_id')
         if recording_id == self._current_recording_id:
             self._is_recording = False
             self._recording_status = "FAILED"
-            self.notify_property_changed('is_recording')
-            self.notify_property_changed('recording_status')
+            with self.batch_notifications():
+                self.notify_property_changed('is_recording')
+                self.notify_property_changed('recording_status')
     
     def _on_action_added(self, event_data):
         """アクション追加イベント"""
-        recording_id = event_data.get('recording_id')
-        if recording_id == self._current_recording_id:
-            self._action_count = event_data.get('action_count', self._action_count + 1)
-            self.notify_property_changed('action_count')
+        if self._recording_service is None:
+            return
+        if event_data.get('recording_id') != self._current_recording_id:
+            return
+        # 通知は変更時のみ行い、連続した追加はイベントループの1ターン分にまとめて通知される
+        action_count = event_data.get('action_count')
+        self._set_action_count(action_count if action_count is not None else self._action_count + 1)
+    
+    def _on_recording_progress(self, event: RecordingProgressEvent):
+        """記録進捗イベント（記録全体を再取得せずに差分を反映）"""
+        if self._recording_service is None:
+            return
+        if event.recording_id != self._current_recording_id:
+            return
+        with self.batch_notifications():
+            self._set_action_count(event.action_count)
+            self._set_estimated_duration(event.estimated_duration_ms / 1000.0)
     
     def _on_recording_updated(self, event_data):
         """記録更新イベント"""
-        asyncio.create_task(self._load_recordings_async())
+        if self._recording_service is None:
+            return
+        self._schedule_reload()
     
     def _on_recording_deleted(self, event_data):
         """記録削除イベント"""
-        asyncio.create_task(self._load_recordings_async())
+        if self._recording_service is None:
+            return
+        self._schedule_reload()
     
     # リソース破棄
     def _dispose_resources(self):
         """リソースの破棄"""
-        # Note: For demo purposes, simplified event cleanup
-        # In production, unsubscribe from EventBus using subscription IDs
+        # イベント購読の解除（1件の失敗で残りの解除を止めない）
+        if self._event_bus:
+            for subscription_id in self._subscription_ids:
+                try:
+                    self._event_bus.unsubscribe(subscription_id)
+                except Exception:
+                    continue
+        self._subscription_ids.clear()
+        
+        # 保留中の検索とバックグラウンドタスクを取り消し
+        self._cancel_pending_search()
+        for task in tuple(self._background_tasks):
+            task.cancel()
+        self._background_tasks.clear()
+        self._reload_task = None
+        self._stats_task = None
+        self._reload_again = False
+        self._stats_reload_again = False
         
         # サービス参照のクリア
         self._recording_service = None
\ No newline at end of file
@@ -4,11 +4,21 @@
 ショートカットキー設定のビジネスロジックを管理します。
 """
 
-from typing import List, Optional, Callable, Set, Tuple
+from typing import Dict, List, Optional, Callable, Set, Tuple
 from src.domain.entities.shortcut_settings import ShortcutSettings, KeyCombination, KeyModifier
 from src.presentation.gui.viewmodels.base_viewmodel import BaseViewModel, Command, Signal
 
 
+# 修飾キー名（小文字）→ ビットマスク（KeyModifier の定義順に1ビットずつ割り当て）
+_MODIFIER_BITS = {modifier.value: 1 << index for index, modifier in enumerate(KeyModifier)}
+
+# ビットマスク → 修飾キー集合（全組み合わせを事前に生成）
+_MODIFIER_SETS = tuple(
+    frozenset(modifier for index, modifier in enumerate(KeyModifier) if mask >> index & 1)
+    for mask in range(1 << len(KeyModifier))
+)
+
+
 class SettingsViewModel(BaseViewModel):
     """設定画面ViewModel"""
     
@@ -18,6 +28,15 @@ class SettingsViewModel(BaseViewModel):
     custom_key_removed = Signal(int)  # 削除されたインデックス
     error_occurred = Signal(str)  # エラーメッセージ
     
+    # キャプチャ用途 → (キーの説明, 設定メソッド名)
+    # 設定メソッドは add_custom_excluded_key のみ成否を返し、他は常に成功扱い
+    _CAPTURE_TARGETS = {
+        "custom": ("カスタム除外キー", "add_custom_excluded_key"),
+        "start_stop": ("記録開始/停止", "set_recording_start_stop_key"),
+        "pause_resume": ("記録一時停止/再開", "set_recording_pause_resume_key"),
+        "emergency_stop": ("緊急停止", "set_emergency_stop_key"),
+    }
+    
     def __init__(self, shortcut_settings: Optional[ShortcutSettings] = None):
         super().__init__()
         self._settings = shortcut_settings or ShortcutSettings()
@@ -28,21 +47,28 @@ class SettingsViewModel(BaseViewModel):
         # 一時的なキー入力状態
         self._capture_mode = False
         self._capturing_for = ""  # "custom", "start_stop", "pause_resume", "emergency_stop"
-        self._temp_modifiers = set()
+        self._temp_modifiers = 0  # 修飾キーのビットマスク
         self._temp_key = ""
+        
+        # 表示用文字列のキャッシュ（設定変更時に破棄）
+        self._key_text_cache: Dict[str, str] = {}
+        self._custom_key_texts: Optional[List[str]] = None
+        
+        # コマンドID → カスタムショートカットコマンド（初回実行時に構築し、設定変更時に破棄）
+        self._command_index: Optional[Dict[str, "CustomShortcutCommand"]] = None
     
     def set_settings_changed_callback(self, callback: Callable[[ShortcutSettings], None]):
-        """設定変更コールバックを設定"""
-        self._on_settings_changed_callback = callback
+        """設定変更コールバックを設定（バインドメソッドは弱参照で保持）"""
+        self._on_settings_changed_callback = self._make_weak_handler(callback)
     
     def get_settings(self) -> ShortcutSettings:
         """現在の設定を取得"""
         return self._settings
     
     def update_settings(self, settings: ShortcutSettings):
-        """設定を更新"""
+        """設定を更新（変更通知と設定変更コールバックを1回ずつ行う）"""
         self._settings = settings
-        self.settings_changed.emit()
+        self._emit_settings_changed()
     
     # システムキー除外設定のプロパティ
     def get_exclude_system_keys(self) -> bool:
@@ -88,7 +114,9 @@ class SettingsViewModel(BaseViewModel):
     # カスタム除外キー管理
     def get_custom_excluded_keys(self) -> List[str]:
         """カスタム除外キーの文字列リストを取得"""
-        return [str(key) for key in self._settings.custom_excluded_keys]
+        if self._custom_key_texts is None:
+            self._custom_key_texts = [str(key) for key in self._settings.custom_excluded_keys]
+        return list(self._custom_key_texts)
     
     def add_custom_excluded_key(self, key_combination: KeyCombination) -> bool:
         """カスタム除外キーを追加"""
@@ -120,23 +148,36 @@ class SettingsViewModel(BaseViewModel):
     
     # RPA制御キー設定
     def get_recording_start_stop_key(self) -> str:
-        return str(self._settings.recording_start_stop_key)
+        return self._get_key_text('recording_start_stop_key')
+    
+    def _get_key_text(self, name: str) -> str:
+        """RPA制御キーの文字列表現を取得（設定変更までキャッシュ）"""
+        text = self._key_text_cache.get(name)
+        if text is None:
+            text = self._key_text_cache[name] = str(getattr(self._settings, name))
+        return text
     
     def set_recording_start_stop_key(self, key_combination: KeyCombination):
+        if self._settings.recording_start_stop_key == key_combination:
+            return
         self._settings.recording_start_stop_key = key_combination
         self._emit_settings_changed()
     
     def get_recording_pause_resume_key(self) -> str:
-        return str(self._settings.recording_pause_resume_key)
+        return self._get_key_text('recording_pause_resume_key')
     
     def set_recording_pause_resume_key(self, key_combination: KeyCombination):
+        if self._settings.recording_pause_resume_key == key_combination:
+            return
         self._settings.recording_pause_resume_key = key_combination
         self._emit_settings_changed()
     
     def get_emergency_stop_key(self) -> str:
-        return str(self._settings.emergency_stop_key)
+        return self._get_key_text('emergency_stop_key')
     
     def set_emergency_stop_key(self, key_combination: KeyCombination):
+        if self._settings.emergency_stop_key == key_combination:
+            return
         self._settings.emergency_stop_key = key_combination
         self._emit_settings_changed()
     
@@ -145,14 +186,14 @@ class SettingsViewModel(BaseViewModel):
         """キー入力キャプチャを開始"""
         self._capture_mode = True
         self._capturing_for = capture_for
-        self._temp_modifiers = set()
+        self._temp_modifiers = 0
         self._temp_key = ""
     
     def stop_key_capture(self):
         """キー入力キャプチャを停止"""
         self._capture_mode = False
         self._capturing_for = ""
-        self._temp_modifiers = set()
+        self._temp_modifiers = 0
         self._temp_key = ""
     
     def is_capturing_keys(self) -> bool:
@@ -169,43 +210,23 @@ class SettingsViewModel(BaseViewModel):
             return False
         
         try:
-            # 修飾キーを変換
-            modifier_set = set()
+            target = self._CAPTURE_TARGETS.get(self._capturing_for)
+            if target is None:
+                return False
+            description, setter_name = target
+            
+            # 修飾キーをビットマスクに畳み込む（未知の修飾キーは無視）
+            mask = 0
             for mod in modifiers:
-                if mod.lower() == "ctrl":
-                    modifier_set.add(KeyModifier.CTRL)
-                elif mod.lower() == "alt":
-                    modifier_set.add(KeyModifier.ALT)
-                elif mod.lower() == "shift":
-                    modifier_set.add(KeyModifier.SHIFT)
-                elif mod.lower() == "win":
-                    modifier_set.add(KeyModifier.WIN)
+                mask |= _MODIFIER_BITS.get(mod.lower(), 0)
             
-            # キー組み合わせを作成
+            # キー組み合わせを作成し、用途に応じて設定
             key_combination = KeyCombination(
-                modifiers=modifier_set,
+                modifiers=set(_MODIFIER_SETS[mask]),
                 key=key.lower(),
-                description=""
+                description=description
             )
-            
-            # 用途に応じて設定
-            if self._capturing_for == "custom":
-                key_combination.description = f"カスタム除外キー"
-                success = self.add_custom_excluded_key(key_combination)
-            elif self._capturing_for == "start_stop":
-                key_combination.description = "記録開始/停止"
-                self.set_recording_start_stop_key(key_combination)
-                success = True
-            elif self._capturing_for == "pause_resume":
-                key_combination.description = "記録一時停止/再開"
-                self.set_recording_pause_resume_key(key_combination)
-                success = True
-            elif self._capturing_for == "emergency_stop":
-                key_combination.description = "緊急停止"
-                self.set_emergency_stop_key(key_combination)
-                success = True
-            else:
-                success = False
+            success = getattr(self, setter_name)(key_combination) is not False
             
             if success:
                 self.stop_key_capture()
@@ -221,7 +242,6 @@ class SettingsViewModel(BaseViewModel):
         """デフォルト設定に復元"""
         try:
             self._settings = ShortcutSettings()
-            self.settings_changed.emit()
             self._emit_settings_changed()
         except Exception as e:
             self.error_occurred.emit(f"デフォルト復元エラー: {str(e)}")
@@ -259,6 +279,19 @@ class SettingsViewModel(BaseViewModel):
             self.error_occurred.emit(f"コマンド追加エラー: {str(e)}")
             return False
     
+    def add_custom_shortcut_commands(self, commands: List["CustomShortcutCommand"]) -> int:
+        """カスタムショートカットコマンドをまとめて追加
+        
+        重複等で追加できないコマンドはエラーにせず読み飛ばし、変更通知は1回だけ行います。
+        
+        Returns:
+            追加したコマンド数
+        """
+        added_count = sum(1 for command in commands if self._settings.add_custom_shortcut_command(command))
+        if added_count:
+            self._emit_settings_changed()
+        return added_count
+    
     def update_custom_shortcut_command(self, command: "CustomShortcutCommand") -> bool:
         """カスタムショートカットコマンドを更新"""
         try:
@@ -292,11 +325,12 @@ class SettingsViewModel(BaseViewModel):
     def execute_custom_command(self, command_id: str) -> bool:
         """カスタムコマンドを実行"""
         try:
-            commands = self.get_custom_shortcut_commands()
-            for command in commands:
-                if command.id == command_id:
-                    return command.execute()
-            return False
+            if self._command_index is None:
+                self._command_index = {
+                    command.id: command for command in self.get_custom_shortcut_commands()
+                }
+            command = self._command_index.get(command_id)
+            return command.execute() if command is not None else False
         except Exception as e:
             self.error_occurred.emit(f"コマンド実行エラー: {str(e)}")
             return False
@@ -313,10 +347,14 @@ class SettingsViewModel(BaseViewModel):
             self._settings.emergency_stop_key
         ]
         
-        for i, key1 in enumerate(control_keys):
-            for j, key2 in enumerate(control_keys[i+1:], i+1):
-                if key1.modifiers == key2.modifiers and key1.key == key2.key:
-                    warnings.append(f"RPA制御キーに重複があります: {key1}")
+        # 同じキー組み合わせごとにまとめ、重複は組み合わせ単位で1件報告
+        control_groups = {}
+        for key in control_keys:
+            control_groups.setdefault((frozenset(key.modifiers), key.key), []).append(key)
+        warnings.extend(
+            f"RPA制御キーに重複があります: {keys[0]}"
+            for keys in control_groups.values() if len(keys) > 1
+        )
         
         # カスタム除外キーの重複チェック
         seen_keys = set()
@@ -324,12 +362,20 @@ class SettingsViewModel(BaseViewModel):
             key_signature = (frozenset(key.modifiers), key.key)
             if key_signature in seen_keys:
                 warnings.append(f"カスタム除外キーに重複があります: {key}")
-            seen_keys.add(key_signature)
+            else:
+                seen_keys.add(key_signature)
         
         return warnings
     
+    def _invalidate_caches(self):
+        """設定から派生したキャッシュを破棄"""
+        self._key_text_cache.clear()
+        self._custom_key_texts = None
+        self._command_index = None
+    
     def _emit_settings_changed(self):
         """設定変更を通知"""
+        self._invalidate_caches()
         self.settings_changed.emit()
         if self._on_settings_changed_callback:
             self._on_settings_changed_callback(self._settings)
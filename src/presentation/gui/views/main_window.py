@@ -224,15 +224,15 @@ class DashboardWidget(QWidget):
         # 最近の記録
         self._recent_recordings_list.clear()
         for recording in self._viewmodel.recent_recordings:
-            item_text = f"{recording['name']} ({recording['action_count']}アクション)"
+            item_text = f"{recording.name} ({recording.action_count}アクション)"
             item = QListWidgetItem(item_text)
             self._recent_recordings_list.addItem(item)
         
         # アクティブなスケジュール
         self._active_schedules_list.clear()
         for schedule in self._viewmodel.active_schedules:
-            next_exec = schedule.get('next_execution', 'N/A')
-            item_text = f"{schedule['name']} (次回: {next_exec})"
+            next_exec = schedule.next_execution or 'N/A'
+            item_text = f"{schedule.name} (次回: {next_exec})"
             item = QListWidgetItem(item_text)
             self._active_schedules_list.addItem(item)
     
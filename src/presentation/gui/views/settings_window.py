@@ -742,7 +742,7 @@ class SettingsWindow(QDialog):
     # カスタムショートカットコマンド関連メソッド
     def _refresh_commands_table(self):
         """コマンドテーブルを更新"""
-        commands = self.viewmodel.get_settings().get_custom_shortcut_commands()
+        commands = self.viewmodel.get_custom_shortcut_commands()
         
         self.commands_table.setRowCount(len(commands))
         
@@ -797,13 +797,11 @@ class SettingsWindow(QDialog):
         dialog = CustomCommandEditDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             command = dialog.get_command()
-            settings = self.viewmodel.get_settings()
             
-            if settings.add_custom_shortcut_command(command):
+            # 失敗時は ViewModel の error_occurred でエラーが表示される
+            if self.viewmodel.add_custom_shortcut_command(command):
                 self._refresh_commands_table()
                 QMessageBox.information(self, "完了", "コマンドが追加されました。")
-            else:
-                QMessageBox.warning(self, "警告", "キー組み合わせが重複しているか、無効な設定です。")
     
     def _edit_custom_command(self):
         """カスタムコマンド編集"""
@@ -811,7 +809,7 @@ class SettingsWindow(QDialog):
         if row < 0:
             return
         
-        commands = self.viewmodel.get_settings().get_custom_shortcut_commands()
+        commands = self.viewmodel.get_custom_shortcut_commands()
         if row >= len(commands):
             return
         
@@ -820,13 +818,10 @@ class SettingsWindow(QDialog):
         
         if dialog.exec() == QDialog.DialogCode.Accepted:
             updated_command = dialog.get_command()
-            settings = self.viewmodel.get_settings()
             
-            if settings.update_custom_shortcut_command(updated_command):
+            if self.viewmodel.update_custom_shortcut_command(updated_command):
                 self._refresh_commands_table()
                 QMessageBox.information(self, "完了", "コマンドが更新されました。")
-            else:
-                QMessageBox.warning(self, "警告", "更新に失敗しました。")
     
     def _duplicate_custom_command(self):
         """カスタムコマンド複製"""
@@ -834,7 +829,7 @@ class SettingsWindow(QDialog):
         if row < 0:
             return
         
-        commands = self.viewmodel.get_settings().get_custom_shortcut_commands()
+        commands = self.viewmodel.get_custom_shortcut_commands()
         if row >= len(commands):
             return
         
@@ -860,13 +855,10 @@ class SettingsWindow(QDialog):
         dialog = CustomCommandEditDialog(new_command, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             command = dialog.get_command()
-            settings = self.viewmodel.get_settings()
             
-            if settings.add_custom_shortcut_command(command):
+            if self.viewmodel.add_custom_shortcut_command(command):
                 self._refresh_commands_table()
                 QMessageBox.information(self, "完了", "コマンドが複製されました。")
-            else:
-                QMessageBox.warning(self, "警告", "キー組み合わせが重複しているか、無効な設定です。")
     
     def _remove_custom_command(self):
         """カスタムコマンド削除"""
@@ -874,7 +866,7 @@ class SettingsWindow(QDialog):
         if row < 0:
             return
         
-        commands = self.viewmodel.get_settings().get_custom_shortcut_commands()
+        commands = self.viewmodel.get_custom_shortcut_commands()
         if row >= len(commands):
             return
         
@@ -888,12 +880,9 @@ class SettingsWindow(QDialog):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            settings = self.viewmodel.get_settings()
-            if settings.remove_custom_shortcut_command(command.id):
+            if self.viewmodel.remove_custom_shortcut_command(command.id):
                 self._refresh_commands_table()
                 QMessageBox.information(self, "完了", "コマンドが削除されました。")
-            else:
-                QMessageBox.warning(self, "警告", "削除に失敗しました。")
     
     def _test_custom_command(self):
         """カスタムコマンドテスト実行"""
@@ -901,7 +890,7 @@ class SettingsWindow(QDialog):
         if row < 0:
             return
         
-        commands = self.viewmodel.get_settings().get_custom_shortcut_commands()
+        commands = self.viewmodel.get_custom_shortcut_commands()
         if row >= len(commands):
             return
         
@@ -928,13 +917,7 @@ class SettingsWindow(QDialog):
         """プリセットコマンド追加"""
         from src.domain.entities.custom_shortcut_command import create_preset_commands
         
-        preset_commands = create_preset_commands()
-        settings = self.viewmodel.get_settings()
-        
-        added_count = 0
-        for command in preset_commands:
-            if settings.add_custom_shortcut_command(command):
-                added_count += 1
+        added_count = self.viewmodel.add_custom_shortcut_commands(create_preset_commands())
         
         if added_count > 0:
             self._refresh_commands_table()
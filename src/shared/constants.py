@@ -82,6 +82,9 @@ class WindowsMessages:
     WM_MBUTTONUP = 0x0208
     WM_MOUSEMOVE = 0x0200
     WM_MOUSEWHEEL = 0x020A
+    
+    # コマンドメッセージ
+    WM_COMMAND = 0x0111
 
 
 class ApplicationConstants:
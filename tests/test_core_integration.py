@@ -15,6 +15,7 @@ from src.core import (
     get_container, get_event_bus, get_thread_manager,
     Result, Ok, Err, 
     RecordingStartedEvent, EventPriority,
+    Event, EventBus, SystemEvent,
     ThreadPriority
 )
 
@@ -140,6 +141,46 @@ class TestCoreIntegration:
         # 高優先度ハンドラーが先に実行されることを確認
         assert execution_order == ["high", "low"]
     
+    def test_event_bus_has_subscribers(self):
+        """イベントバス購読者判定テスト"""
+        event_bus = EventBus()
+        try:
+            assert not event_bus.has_subscribers(RecordingStartedEvent)
+            
+            # 基底クラスの購読は派生イベントにも適用される
+            subscription_id = event_bus.subscribe(Event, lambda event: None)
+            assert event_bus.has_subscribers(RecordingStartedEvent)
+            
+            # 購読解除後は購読者なし
+            event_bus.unsubscribe(subscription_id)
+            assert not event_bus.has_subscribers(RecordingStartedEvent)
+            
+            # 無関係なイベントタイプの購読は影響しない
+            event_bus.subscribe(RecordingStartedEvent, lambda event: None)
+            assert not event_bus.has_subscribers(SystemEvent)
+        finally:
+            event_bus.shutdown()
+    
+    def test_event_bus_subscribe_many(self):
+        """イベントバス一括購読テスト"""
+        event_bus = EventBus()
+        try:
+            subscription_ids = event_bus.subscribe_many({
+                RecordingStartedEvent: lambda event: None,
+                SystemEvent: lambda event: None
+            })
+            
+            assert len(subscription_ids) == 2
+            assert event_bus.has_subscribers(RecordingStartedEvent)
+            assert event_bus.has_subscribers(SystemEvent)
+            
+            # 返却された購読IDで個別に解除できる
+            assert event_bus.unsubscribe(subscription_ids[0])
+            assert not event_bus.has_subscribers(RecordingStartedEvent)
+            assert event_bus.has_subscribers(SystemEvent)
+        finally:
+            event_bus.shutdown()
+    
     def test_thread_manager_basic(self):
         """スレッドマネージャー基本機能テスト"""
         thread_manager = get_thread_manager()
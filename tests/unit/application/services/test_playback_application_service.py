@@ -314,6 +314,41 @@ class TestPlaybackApplicationService:
             assert result.is_success()
             assert service._performance_metrics['successful_playbacks'] == initial_successful + 1
     
+    @pytest.mark.asyncio
+    async def test_stop_all_playbacks(self, service):
+        """全再生停止のテスト"""
+        # Arrange
+        session_ids = ["session_1", "session_2"]
+        for session_id in session_ids:
+            service._active_sessions[session_id] = PlaybackDTO.create_new(
+                session_id=session_id,
+                recording_id="test_recording_id",
+                recording_name="Test Recording",
+                config=PlaybackConfigDTO()
+            )
+        
+        result_data = {
+            'start_time': datetime.now(timezone.utc),
+            'end_time': datetime.now(timezone.utc),
+            'duration_seconds': 10.0,
+            'total_actions': 5,
+            'actions_executed': 5,
+            'completion_rate': 1.0,
+            'status': 'completed'
+        }
+        
+        with patch.object(service._stop_playback_use_case, 'execute') as mock_stop:
+            mock_stop.return_value = Ok(result_data)
+            
+            # Act
+            result = await service.stop_all_playbacks()
+            
+            # Assert
+            assert result.is_success()
+            assert result.value == session_ids
+            assert mock_stop.call_count == 2
+            assert len(service._active_sessions) == 0
+    
     # ========================
     # get_playback_status テスト
     # ========================
@@ -18,6 +18,7 @@ from src.application.dto.recording_dto import (
     RecordingSearchDTO
 )
 from src.core.result import Result, Ok, Err, ErrorInfo
+from src.core.event_bus import RecordingProgressEvent
 from src.domain.entities.recording import Recording
 from src.domain.entities.action import KeyboardAction
 from src.domain.value_objects import RecordingStatus
@@ -72,15 +73,23 @@ class TestRecordingApplicationService:
         mock_service.load_file.return_value = Ok("file_content")
         return mock_service
     
+    @pytest.fixture
+    def mock_event_bus(self):
+        """モックイベントバス（グローバルのイベントバスから切り離す）"""
+        mock_bus = Mock()
+        mock_bus.has_subscribers.return_value = False
+        return mock_bus
+    
     @pytest.fixture
     def service(self, mock_recording_repository, mock_settings_repository, 
-                mock_encryption_service, mock_file_service):
+                mock_encryption_service, mock_file_service, mock_event_bus):
         """テスト対象のアプリケーションサービス"""
         return RecordingApplicationService(
             recording_repository=mock_recording_repository,
             settings_repository=mock_settings_repository,
             encryption_service=mock_encryption_service,
-            file_service=mock_file_service
+            file_service=mock_file_service,
+            event_bus=mock_event_bus
         )
     
     # ========================
@@ -169,6 +178,30 @@ class TestRecordingApplicationService:
             assert result.value is True
             mock_recording_repository.save.assert_called_once()
     
+    @pytest.mark.asyncio
+    async def test_create_and_start_recording_success(self, service, mock_recording_repository):
+        """記録作成・開始成功のテスト（保存は1回のみ）"""
+        # Arrange
+        create_dto = CreateRecordingDTOFactory()
+        mock_recording_repository.get_by_name.return_value = Err(
+            ErrorInfo("RECORDING_NOT_FOUND", "not found")
+        )
+        
+        # Act
+        result = await service.create_and_start_recording(create_dto)
+        
+        # Assert
+        assert result.is_success()
+        assert result.value.status == RecordingStatus.RECORDING.value
+        assert result.value.metadata.category == create_dto.category
+        mock_recording_repository.get_by_name.assert_called_once_with(create_dto.name)
+        mock_recording_repository.get_by_id.assert_not_called()
+        mock_recording_repository.save.assert_called_once()
+        saved_recording = mock_recording_repository.save.call_args[0][0]
+        assert saved_recording.recording_id == result.value.recording_id
+        assert saved_recording.status == RecordingStatus.RECORDING
+        assert saved_recording.metadata.tags == list(create_dto.tags)
+    
     @pytest.mark.asyncio
     async def test_start_recording_already_recording(self, service):
         """既に記録中の記録の開始テスト"""
@@ -235,11 +268,12 @@ class TestRecordingApplicationService:
     async def test_add_action_success(self, service):
         """アクション追加成功のテスト"""
         # Arrange
-        recording_id = "test_recording_id"
+        test_recording = RecordingFactory()
+        recording_id = test_recording.recording_id
         action = KeyboardActionFactory()
         
         with patch.object(service._add_action_use_case, 'execute') as mock_execute:
-            mock_execute.return_value = Ok(True)
+            mock_execute.return_value = Ok(test_recording)
             
             # Act
             result = await service.add_action(recording_id, action)
@@ -249,6 +283,29 @@ class TestRecordingApplicationService:
             assert result.value is True
             mock_execute.assert_called_once_with(recording_id, action)
     
+    @pytest.mark.asyncio
+    async def test_add_action_publishes_progress_event(self, service, mock_recording_repository,
+                                                       mock_event_bus):
+        """アクション追加時の進捗イベント発行テスト（記録を再取得しない）"""
+        # Arrange
+        test_recording = RecordingFactory()
+        recording_id = test_recording.recording_id
+        mock_event_bus.has_subscribers.return_value = True
+        
+        with patch.object(service._add_action_use_case, 'execute') as mock_execute:
+            mock_execute.return_value = Ok(test_recording)
+            
+            # Act
+            result = await service.add_action(recording_id, KeyboardActionFactory())
+            
+            # Assert
+            assert result.is_success()
+            mock_recording_repository.get_by_id.assert_not_called()
+            event = mock_event_bus.publish.call_args[0][0]
+            assert isinstance(event, RecordingProgressEvent)
+            assert event.recording_id == recording_id
+            assert event.action_count == test_recording.action_count
+    
     @pytest.mark.asyncio
     async def test_add_action_failure(self, service):
         """アクション追加失敗のテスト"""
@@ -578,6 +635,26 @@ class TestRecordingApplicationService:
         assert result.value.total_recordings == 10
         mock_recording_repository.get_statistics.assert_not_called()
     
+    @pytest.mark.asyncio
+    async def test_has_any_recordings(self, service, mock_recording_repository):
+        """記録存在確認のテスト（件数のみ取得）"""
+        # Arrange
+        mock_recording_repository.count.return_value = Ok(3)
+        
+        # Act
+        result = await service.has_any_recordings()
+        
+        # Assert
+        assert result.is_success()
+        assert result.value is True
+        mock_recording_repository.get_all.assert_not_called()
+        
+        # 0件の場合
+        mock_recording_repository.count.return_value = Ok(0)
+        result = await service.has_any_recordings()
+        assert result.is_success()
+        assert result.value is False
+    
     # ========================
     # キャッシュ管理テスト
     # ========================